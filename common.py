@@ -0,0 +1,155 @@
+"""
+common.py
+
+Helpers and constants shared by the pipeline stages (Parts 1-6): the text
+normalisation, date parsing and report writing every stage does the same
+way. It depends only on numpy, pandas and (optionally) pyarrow, so each
+stage module stays importable on its own.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Iterable, Sequence, TextIO, Tuple
+
+try:  # optional: Arrow-backed strings
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+
+# Text columns are upgraded to this dtype before the .str kernels run; with
+# pyarrow their regex calls would go to Arrow's RE2 engine (see regex_text)
+STRING_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+# Write buffer for the text reports Parts 2-4 and 6 stream to disk
+REPORT_BUFFER_SIZE = 1024 * 1024
+
+# Everything that is not a digit; stripped from phone values
+NON_DIGIT_RE = re.compile(r"\D")
+
+# Superset of what the parse_dates formats accept (digits, optionally
+# space-padded, split by '-' or '/'); gates the strptime retry
+DATE_SHAPE_PATTERN = r"[0-9 ]{1,4}[-/][0-9 ]{1,2}[-/][0-9 ]{1,4}"
+
+
+
+
+# Shared helpers
+
+def normalize_text(series: pd.Series) -> pd.Series:
+    """
+    The one normalisation pass per column: STRING_DTYPE, surrounding
+    whitespace stripped, blank cells turned into NA, so later checks treat
+    NA as the only missing sentinel.
+    """
+    stripped = series.astype(STRING_DTYPE).str.strip()
+    return stripped.mask(stripped.eq(""))
+
+
+def regex_text(series: pd.Series) -> pd.Series:
+    """
+    series as object dtype, so .str regex methods run on Python's re.
+
+    On STRING_DTYPE they run on Arrow's RE2, where \\d, \\s and \\w are
+    ASCII-only; re also matches e.g. full-width digits, as the per-cell
+    checks always did.
+    """
+    return series.astype(object)
+
+
+def parse_floats(stripped: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a stripped text column the way float() parses each cell.
+
+    pd.to_numeric handles the bulk; the cells it rejects are retried with
+    float(), which also accepts e.g. "1_000", "nan" and non-ASCII digits.
+
+    Returns
+    -------
+    (values, parsed)
+        float64 values (NaN where not parsed) and a boolean array, True
+        where float() accepted the cell.
+    """
+    values = pd.to_numeric(stripped, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    parsed = ~np.isnan(values)
+    cells = stripped.to_numpy(dtype=object, na_value="")
+    for i in np.flatnonzero(~parsed & (cells != "")):
+        try:
+            values[i] = float(cells[i])
+            parsed[i] = True
+        except ValueError:
+            pass
+    return values, parsed
+
+
+def parse_dates(stripped: pd.Series, formats: Sequence[str]) -> np.ndarray:
+    """
+    Parse a stripped date column once per format; the first format that
+    parses a cell wins, as with strptime tried in order.
+
+    Parameters
+    ----------
+    stripped : pd.Series
+        String column, already stripped.
+    formats : sequence of str
+        strptime formats, tried in order.
+
+    Returns
+    -------
+    np.ndarray
+        datetime64[D] values, NaT where no format matched.
+    """
+    parsed = pd.to_datetime(stripped, format=formats[0], errors="coerce")
+    for fmt in formats[1:]:
+        parsed = parsed.fillna(pd.to_datetime(stripped, format=fmt, errors="coerce"))
+    # Via seconds: numpy's direct ns -> D cast overflows for days close to
+    # the datetime64[ns] minimum (1677-09-22 came back as 2262-04-11)
+    days = parsed.to_numpy(dtype="datetime64[s]").astype("datetime64[D]")
+
+    # pandas 2.x parses into datetime64[ns], so dates outside 1677-2262
+    # (e.g. 1600-01-01) come back NaT. Only date-shaped leftovers can be
+    # such dates; literals and junk never reach strptime.
+    leftover = np.flatnonzero(
+        np.isnat(days) & stripped.ne("").to_numpy(dtype=bool, na_value=False)
+    )
+    if leftover.size:
+        candidates = stripped.iloc[leftover]
+        shaped = candidates.str.fullmatch(DATE_SHAPE_PATTERN).to_numpy(dtype=bool, na_value=False)
+        for i, value in zip(leftover[shaped], candidates[shaped]):
+            for fmt in formats:
+                try:
+                    days[i] = np.datetime64(datetime.strptime(value, fmt).date(), "D")
+                    break
+                except ValueError:
+                    pass
+    return days
+
+
+def write_lines(lines: Iterable[str], f: TextIO) -> None:
+    """Write lines to f separated by newlines (no trailing newline)."""
+    it = iter(lines)
+    f.write(next(it, ""))
+    f.writelines("\n" + line for line in it)
+
+
+class LineWriter:
+    """
+    Stand-in for a report line list that streams each line straight to f
+    (newline-separated, no trailing newline) instead of keeping it.
+    """
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+        self._sep = ""
+
+    def append(self, line: str) -> None:
+        self._f.write(self._sep + line)
+        self._sep = "\n"
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
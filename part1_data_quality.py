@@ -13,15 +13,29 @@ Profiles the raw customer CSV for:
   - account_status categorical validity
   - Severity classification of all issues
 
-Exposes run_quality_analysis(df) for import by the pipeline orchestrator,
-and can also be executed standalone via __main__.
+Exposes run_quality_analysis(df) and load_raw_csv(path) for import by the
+pipeline orchestrator, and can also be executed standalone via __main__.
 """
 
+import csv
+import io
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime, date
-from typing import Dict, List, Tuple, Any
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Any
+
+try:  # optional: Arrow CSV reader and Arrow-backed strings
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from common import parse_dates, parse_floats
 
 
 
@@ -58,6 +72,26 @@ DATE_PATTERNS: Dict[str, str] = {
 }
 
 
+def _union_regex(patterns: Dict[str, str], flags: int = 0) -> "re.Pattern[str]":
+    """Compile patterns into one alternation with a named group per format."""
+    return re.compile(
+        "|".join(f"(?P<g{i}>{p})" for i, p in enumerate(patterns.values())),
+        flags,
+    )
+
+
+# Single-pass classifiers: the first alternative that matches names the format
+PHONE_FORMAT_REGEX = _union_regex(PHONE_PATTERNS)
+DATE_FORMAT_REGEX = _union_regex(DATE_PATTERNS, re.IGNORECASE)
+
+# strptime formats tried in order when parsing each date column
+DOB_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y")
+CREATED_DATE_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%m/%d/%Y")
+
+# A date of birth more than this many days ago implies age > 150 years
+MAX_AGE_DAYS = 150 * 365.25
+
+
 
 
 # Helper functions
@@ -68,7 +102,189 @@ def _is_blank(val: Any) -> bool:
     return str(val).strip() == ""
 
 
-def check_completeness(df: pd.DataFrame) -> Dict[str, Dict]:
+def _blank_mask(series: pd.Series) -> pd.Series:
+    """Vectorised _is_blank: boolean mask of NaN or whitespace-only cells."""
+    mask = series.isna()
+    blank = (
+        series[~mask].astype("string").str.strip().eq("")
+        .reindex(series.index, fill_value=False)
+    )
+    return mask | blank.astype(bool)
+
+
+def _classify_formats(
+    series: pd.Series,
+    patterns: Dict[str, str],
+    union: "re.Pattern[str]",
+    fallback: str,
+) -> Dict[str, List[str]]:
+    """
+    Label each non-blank value with the first pattern it matches.
+
+    Parameters
+    ----------
+    series : pd.Series
+    patterns : dict
+        Mapping format_name -> anchored regex, in priority order.
+    union : re.Pattern
+        patterns compiled by _union_regex.
+    fallback : str
+        Label for values matching none of the patterns.
+
+    Returns
+    -------
+    dict
+        Mapping format_name -> list of example values, keyed in order of
+        first appearance.
+    """
+    s = series.dropna().astype("string").str.strip()
+    s = s[s.ne("")]
+    hit = s.str.extract(union).notna().to_numpy(dtype=bool)
+    names = np.array(list(patterns), dtype=object)
+    if hit.size:
+        labels = np.where(hit.any(axis=1), names[hit.argmax(axis=1)], fallback)
+    else:
+        labels = np.full(len(s), fallback, dtype=object)
+    values = pd.Series(s.tolist(), dtype=object)
+    return values.groupby(labels, sort=False).agg(list).to_dict()
+
+
+def _compute_masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Compute every row-level boolean mask the checks need in one pass.
+
+    Each column is loaded and normalised once here; check_completeness,
+    check_invalid_values, check_account_status and check_name_casing then
+    only select rows from these arrays.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw data loaded as strings (dtype=object).
+
+    Returns
+    -------
+    dict
+        Mapping mask name -> ndarray aligned with df's rows:
+        "<col>:blank" for every column (and their union "any_blank"),
+        "<col>:invalid_date" for the date
+        columns, "<col>:name_all_caps" and
+        "<col>:name_all_lower" for the name columns, plus
+        non_numeric_income, negative_income, income_exceeds_10M,
+        extreme_age, future_created_date, invalid_account_status and the
+        float array age_years.
+    """
+    masks: Dict[str, np.ndarray] = {}
+    any_blank = np.zeros(len(df), dtype=bool)
+    for col in df.columns:
+        masks[f"{col}:blank"] = _blank_mask(df[col]).to_numpy(dtype=bool)
+        any_blank |= masks[f"{col}:blank"]
+    masks["any_blank"] = any_blank
+
+    # Income
+    income = df["income"].astype("string").str.strip()
+    nums, numeric = parse_floats(income)
+    masks["non_numeric_income"] = ~masks["income:blank"] & ~numeric
+    masks["negative_income"] = nums < 0
+    masks["income_exceeds_10M"] = nums > 10_000_000
+
+    # Dates
+    for col in ("date_of_birth", "created_date"):
+        if col in df.columns:
+            literal = df[col].astype("string").str.strip().str.lower()
+            masks[f"{col}:invalid_date"] = (
+                literal.eq("invalid_date").to_numpy(dtype=bool, na_value=False)
+            )
+    today = np.datetime64(date.today(), "D")
+    dob = parse_dates(df["date_of_birth"].astype("string").str.strip(), DOB_FORMATS)
+    known = ~np.isnat(dob)
+    age_days = (today - dob).astype("int64")  # meaningless where ~known
+    masks["extreme_age"] = known & (age_days > MAX_AGE_DAYS)
+    masks["age_years"] = np.where(known, age_days / 365.25, np.nan)
+    created = parse_dates(df["created_date"].astype("string").str.strip(), CREATED_DATE_FORMATS)
+    masks["future_created_date"] = created > today
+
+    # account_status — validate each distinct category once, then broadcast
+    # the verdict to rows through the integer codes. Nulls (code -1) and
+    # blanks are handled by the completeness check.
+    status = df["account_status"]
+    if not isinstance(status.dtype, pd.CategoricalDtype):
+        status = status.astype("category")
+    labels = pd.Series(status.cat.categories).astype("string").str.strip().str.lower()
+    bad_label = (
+        labels.ne("") & ~labels.isin(VALID_ACCOUNT_STATUSES)
+    ).to_numpy(dtype=bool)
+    masks["invalid_account_status"] = np.append(bad_label, False)[
+        status.cat.codes.to_numpy()
+    ]
+
+    # Name casing
+    for col in ("first_name", "last_name"):
+        names = df[col].astype("string").str.strip()
+        multi = names.str.len() > 1
+        masks[f"{col}:name_all_caps"] = (
+            (names.str.isupper() & multi).to_numpy(dtype=bool, na_value=False)
+        )
+        masks[f"{col}:name_all_lower"] = (
+            (names.str.islower() & multi).to_numpy(dtype=bool, na_value=False)
+        )
+
+    return masks
+
+
+def _mask_issues(
+    df: pd.DataFrame,
+    col: str,
+    rules: List[Tuple[str, str, str]],
+    masks: Dict[str, np.ndarray],
+    extra: Optional[Dict[str, np.ndarray]] = None,
+) -> List[Dict]:
+    """
+    Turn precomputed masks into issue records for one column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    col : str
+        Column the issues are reported against.
+    rules : list of (mask_name, issue_type, severity)
+        When several rules flag the same row, the first one wins.
+    masks : dict
+        Output of _compute_masks.
+    extra : dict, optional
+        Additional per-row arrays copied into each record under their key.
+
+    Returns
+    -------
+    list of issue dicts, in row order.
+    """
+    kinds = np.select(
+        [masks[name] for name, _, _ in rules],
+        np.arange(len(rules)),
+        default=-1,
+    )
+    hits = np.flatnonzero(kinds >= 0)
+    rows = (df.index[hits] + 2).tolist()
+    values = df[col].to_numpy()[hits]
+    issues = [
+        {
+            "type": rules[k][1],
+            "column": col,
+            "row": row,
+            "value": val,
+            "severity": rules[k][2],
+        }
+        for k, row, val in zip(kinds[hits].tolist(), rows, values)
+    ]
+    for key, extra_values in (extra or {}).items():
+        for issue, x in zip(issues, extra_values[hits].tolist()):
+            issue[key] = x
+    return issues
+
+
+def check_completeness(
+    df: pd.DataFrame, masks: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, Dict]:
     """
     Calculate completeness for every column.
 
@@ -76,6 +292,8 @@ def check_completeness(df: pd.DataFrame) -> Dict[str, Dict]:
     ----------
     df : pd.DataFrame
         Raw data loaded as strings (dtype=object).
+    masks : dict, optional
+        Precomputed output of _compute_masks.
 
     Returns
     -------
@@ -85,12 +303,22 @@ def check_completeness(df: pd.DataFrame) -> Dict[str, Dict]:
     total = len(df)
     results: Dict[str, Dict] = {}
     for col in df.columns:
-        missing = int(df[col].apply(_is_blank).sum())
+        blank = masks[f"{col}:blank"] if masks else _blank_mask(df[col])
+        missing = int(blank.sum())
         pct = round((total - missing) / total * 100, 1)
         results[col] = {"total": total, "missing": missing, "complete_pct": pct}
     return results
 
 
+def _dtype_matches(dtype: Any, expected_dtype: str) -> bool:
+    """Return True if a detected dtype satisfies an EXPECTED_TYPES entry."""
+    if expected_dtype == "object":
+        # object, string[python] and string[pyarrow] all hold text
+        return pd.api.types.is_string_dtype(dtype)
+    # Broad match: int64 starts with 'int', float64 starts with 'float', etc.
+    return str(dtype).startswith(expected_dtype.split("6")[0].split("[")[0])
+
+
 def check_data_types(df: pd.DataFrame) -> Dict[str, Dict]:
     """
     Compare detected pandas dtype against the expected schema type.
@@ -106,13 +334,11 @@ def check_data_types(df: pd.DataFrame) -> Dict[str, Dict]:
         Mapping column -> {detected, expected, correct, note}.
     """
     results: Dict[str, Dict] = {}
-    for col in df.columns:
-        detected = str(df[col].dtype)
+    for col, dtype in df.dtypes.items():
         expected_dtype, expected_label = EXPECTED_TYPES.get(col, ("object", "UNKNOWN"))
-        # Broad match: int64 starts with 'int', float64 starts with 'float', etc.
-        correct = detected.startswith(expected_dtype.split("6")[0].split("[")[0])
+        correct = _dtype_matches(dtype, expected_dtype)
         results[col] = {
-            "detected": detected,
+            "detected": str(dtype),
             "expected": expected_label,
             "correct": correct,
             "note": "" if correct else f"should be {expected_label}",
@@ -133,20 +359,9 @@ def detect_phone_formats(df: pd.DataFrame) -> Dict[str, List[str]]:
     dict
         Mapping format_name -> list of example values.
     """
-    format_map: Dict[str, List[str]] = {}
-    for val in df["phone"].dropna():
-        v = str(val).strip()
-        if not v:
-            continue
-        matched = False
-        for name, pattern in PHONE_PATTERNS.items():
-            if re.match(pattern, v):
-                format_map.setdefault(name, []).append(v)
-                matched = True
-                break
-        if not matched:
-            format_map.setdefault("Other / Unrecognised", []).append(v)
-    return format_map
+    return _classify_formats(
+        df["phone"], PHONE_PATTERNS, PHONE_FORMAT_REGEX, "Other / Unrecognised"
+    )
 
 
 def detect_date_formats(df: pd.DataFrame) -> Dict[str, Dict[str, List[str]]]:
@@ -167,19 +382,9 @@ def detect_date_formats(df: pd.DataFrame) -> Dict[str, Dict[str, List[str]]]:
     for col in date_cols:
         if col not in df.columns:
             continue
-        col_map: Dict[str, List[str]] = {}
-        for val in df[col].dropna():
-            v = str(val).strip()
-            if not v:
-                continue
-            matched = False
-            for name, pattern in DATE_PATTERNS.items():
-                if re.match(pattern, v, re.IGNORECASE):
-                    col_map.setdefault(name, []).append(v)
-                    matched = True
-                    break
-            if not matched:
-                col_map.setdefault("Other / Unparseable", []).append(v)
+        col_map = _classify_formats(
+            df[col], DATE_PATTERNS, DATE_FORMAT_REGEX, "Other / Unparseable"
+        )
         results[col] = col_map
     return results
 
@@ -195,21 +400,29 @@ def check_uniqueness(df: pd.DataFrame) -> Dict:
     Returns
     -------
     dict
-        is_unique, duplicate count, and list of duplicated id rows.
+        is_unique, duplicate count, 1-based row numbers of the duplicated
+        rows, and the duplicated id values.
     """
-    ids = df["customer_id"].dropna().astype(str)
-    dupe_mask = df["customer_id"].astype(str).duplicated(keep=False)
-    dupes = df[dupe_mask][["customer_id"]].copy()
-    dupes.index = dupes.index + 2  # 1-based row number for readability
+    ids = df["customer_id"]
+    dupe_mask = ids.duplicated(keep=False).to_numpy()
     return {
-        "is_unique": not dupe_mask.any(),
+        "is_unique": not bool(dupe_mask.any()),
         "duplicate_count": int(dupe_mask.sum()),
-        "duplicated_rows": dupes.to_dict("records"),
-        "duplicated_ids": list(df[dupe_mask]["customer_id"].unique()),
+        "duplicated_row_numbers": (df.index[dupe_mask] + 2).tolist(),
+        "duplicated_ids": ids[dupe_mask].unique().tolist(),
     }
 
 
-def check_invalid_values(df: pd.DataFrame) -> List[Dict]:
+INCOME_RULES: List[Tuple[str, str, str]] = [
+    ("non_numeric_income", "non_numeric_income", "Critical"),
+    ("negative_income",    "negative_income",    "High"),
+    ("income_exceeds_10M", "income_exceeds_10M", "Medium"),
+]
+
+
+def check_invalid_values(
+    df: pd.DataFrame, masks: Optional[Dict[str, np.ndarray]] = None
+) -> List[Dict]:
     """
     Detect specific invalid-value conditions in the dataset.
 
@@ -223,174 +436,91 @@ def check_invalid_values(df: pd.DataFrame) -> List[Dict]:
     Parameters
     ----------
     df : pd.DataFrame
+    masks : dict, optional
+        Precomputed output of _compute_masks.
 
     Returns
     -------
     list of dicts, each describing one issue instance.
     """
+    if masks is None:
+        masks = _compute_masks(df)
     issues: List[Dict] = []
-    today = date.today()
 
     # Literal "invalid_date" in date columns
     for col in ["date_of_birth", "created_date"]:
         if col in df.columns:
-            for idx, val in df[col].items():
-                if str(val).strip().lower() == "invalid_date":
-                    issues.append({
-                        "type": "invalid_date_string",
-                        "column": col,
-                        "row": int(idx) + 2,
-                        "value": val,
-                        "severity": "Critical",
-                    })
+            issues.extend(_mask_issues(
+                df, col, [(f"{col}:invalid_date", "invalid_date_string", "Critical")],
+                masks,
+            ))
 
     # Income checks
-    for idx, val in df["income"].items():
-        v = str(val).strip()
-        if not v:
-            continue
-        try:
-            num = float(v)
-        except ValueError:
-            issues.append({
-                "type": "non_numeric_income",
-                "column": "income",
-                "row": int(idx) + 2,
-                "value": val,
-                "severity": "Critical",
-            })
-            continue
-        if num < 0:
-            issues.append({
-                "type": "negative_income",
-                "column": "income",
-                "row": int(idx) + 2,
-                "value": val,
-                "severity": "High",
-            })
-        if num > 10_000_000:
-            issues.append({
-                "type": "income_exceeds_10M",
-                "column": "income",
-                "row": int(idx) + 2,
-                "value": val,
-                "severity": "Medium",
-            })
+    issues.extend(_mask_issues(df, "income", INCOME_RULES, masks))
 
     # date_of_birth: age > 150
-    for idx, val in df["date_of_birth"].items():
-        v = str(val).strip()
-        if not v or v.lower() == "invalid_date":
-            continue
-        try:
-            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-                try:
-                    dob = datetime.strptime(v, fmt).date()
-                    break
-                except ValueError:
-                    dob = None
-            if dob:
-                age = (today - dob).days / 365.25
-                if age > 150:
-                    issues.append({
-                        "type": "extreme_age",
-                        "column": "date_of_birth",
-                        "row": int(idx) + 2,
-                        "value": val,
-                        "severity": "High",
-                        "age_years": round(age, 1),
-                    })
-        except Exception:
-            pass
+    issues.extend(_mask_issues(
+        df, "date_of_birth", [("extreme_age", "extreme_age", "High")], masks,
+        extra={"age_years": np.round(masks["age_years"], 1)},
+    ))
 
     # created_date: future dates
-    for idx, val in df["created_date"].items():
-        v = str(val).strip()
-        if not v or v.lower() == "invalid_date":
-            continue
-        try:
-            for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
-                try:
-                    cd = datetime.strptime(v, fmt).date()
-                    break
-                except ValueError:
-                    cd = None
-            if cd and cd > today:
-                issues.append({
-                    "type": "future_created_date",
-                    "column": "created_date",
-                    "row": int(idx) + 2,
-                    "value": val,
-                    "severity": "Medium",
-                })
-        except Exception:
-            pass
+    issues.extend(_mask_issues(
+        df, "created_date",
+        [("future_created_date", "future_created_date", "Medium")], masks,
+    ))
 
     return issues
 
 
-def check_account_status(df: pd.DataFrame) -> List[Dict]:
+def check_account_status(
+    df: pd.DataFrame, masks: Optional[Dict[str, np.ndarray]] = None
+) -> List[Dict]:
     """
     Verify account_status contains only allowed values.
 
     Parameters
     ----------
     df : pd.DataFrame
+    masks : dict, optional
+        Precomputed output of _compute_masks.
 
     Returns
     -------
     list of dicts for each invalid value found.
     """
-    issues: List[Dict] = []
-    for idx, val in df["account_status"].items():
-        v = str(val).strip().lower()
-        if not v or pd.isna(val):
-            continue  # nulls handled by completeness check
-        if v not in VALID_ACCOUNT_STATUSES:
-            issues.append({
-                "type": "invalid_account_status",
-                "column": "account_status",
-                "row": int(idx) + 2,
-                "value": val,
-                "severity": "High",
-            })
-    return issues
+    if masks is None:
+        masks = _compute_masks(df)
+    return _mask_issues(
+        df, "account_status",
+        [("invalid_account_status", "invalid_account_status", "High")], masks,
+    )
 
 
-def check_name_casing(df: pd.DataFrame) -> List[Dict]:
+def check_name_casing(
+    df: pd.DataFrame, masks: Optional[Dict[str, np.ndarray]] = None
+) -> List[Dict]:
     """
     Detect names that are fully uppercase or fully lowercase.
 
     Parameters
     ----------
     df : pd.DataFrame
+    masks : dict, optional
+        Precomputed output of _compute_masks.
 
     Returns
     -------
     list of dicts for each casing issue.
     """
+    if masks is None:
+        masks = _compute_masks(df)
     issues: List[Dict] = []
     for col in ["first_name", "last_name"]:
-        for idx, val in df[col].items():
-            v = str(val).strip()
-            if not v:
-                continue
-            if v.isupper() and len(v) > 1:
-                issues.append({
-                    "type": "name_all_caps",
-                    "column": col,
-                    "row": int(idx) + 2,
-                    "value": val,
-                    "severity": "Medium",
-                })
-            elif v.islower() and len(v) > 1:
-                issues.append({
-                    "type": "name_all_lower",
-                    "column": col,
-                    "row": int(idx) + 2,
-                    "value": val,
-                    "severity": "Medium",
-                })
+        issues.extend(_mask_issues(df, col, [
+            (f"{col}:name_all_caps",  "name_all_caps",  "Medium"),
+            (f"{col}:name_all_lower", "name_all_lower", "Medium"),
+        ], masks))
     return issues
 
 
@@ -404,6 +534,7 @@ def build_report(
     status_issues: List[Dict],
     name_issues: List[Dict],
     df: pd.DataFrame,
+    blank_row_mask: Optional[np.ndarray] = None,
 ) -> str:
     """
     Assemble all analysis results into a human-readable report string.
@@ -419,62 +550,122 @@ def build_report(
     status_issues : list
     name_issues : list
     df : pd.DataFrame
+    blank_row_mask : np.ndarray, optional
+        True for rows with at least one missing value; recomputed from df
+        when not supplied.
 
     Returns
     -------
     str
         Formatted DATA QUALITY PROFILE REPORT.
     """
-    lines: List[str] = []
-    lines.append("DATA QUALITY PROFILE REPORT")
-    lines.append("")
+    if blank_row_mask is None:
+        blank_row_mask = np.zeros(len(df), dtype=bool)
+        for col in df.columns:
+            blank_row_mask |= _blank_mask(df[col]).to_numpy(dtype=bool)
+    return _render_report(
+        completeness, type_info, phone_formats, date_formats, uniqueness,
+        invalid_vals, status_issues, name_issues,
+        n_rows=len(df),
+        n_cols=len(df.columns),
+        phone_first_rows=_phone_first_rows(df),
+        blank_rows=set((df.index[blank_row_mask] + 2).tolist()),
+    )
+
+
+def _phone_first_rows(df: pd.DataFrame) -> Dict[str, int]:
+    """Map each stripped phone value to the row number of its first occurrence."""
+    phones = df["phone"].dropna().astype("string").str.strip()
+    firsts = phones[~phones.duplicated()]
+    return dict(zip(firsts.tolist(), (firsts.index + 2).tolist()))
+
+
+def _render_report(
+    completeness: Dict,
+    type_info: Dict,
+    phone_formats: Dict,
+    date_formats: Dict,
+    uniqueness: Dict,
+    invalid_vals: List[Dict],
+    status_issues: List[Dict],
+    name_issues: List[Dict],
+    n_rows: int,
+    n_cols: int,
+    phone_first_rows: Dict[str, int],
+    blank_rows: set,
+) -> str:
+    """
+    Format the report from findings alone, without the source DataFrame.
+
+    Parameters
+    ----------
+    completeness, type_info, phone_formats, date_formats, uniqueness,
+    invalid_vals, status_issues, name_issues
+        As for build_report.
+    n_rows, n_cols : int
+        Shape of the profiled data.
+    phone_first_rows : dict
+        Output of _phone_first_rows.
+    blank_rows : set of int
+        1-based row numbers with at least one missing value.
+
+    Returns
+    -------
+    str
+    """
+    buf = io.StringIO()
+
+    def w(line: str = "") -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    w("DATA QUALITY PROFILE REPORT")
+    w()
 
     # --- COMPLETENESS ---
-    lines.append("COMPLETENESS:")
+    w("COMPLETENESS:")
     for col, info in completeness.items():
         pct = info["complete_pct"]
         miss = info["missing"]
         marker = "[OK]" if miss == 0 else "[FAIL]"
         note = f"({miss} missing)" if miss > 0 else "(no missing values)"
-        lines.append(f"  - {col}: {pct}% {note} {marker}")
-    lines.append("")
+        w(f"  - {col}: {pct}% {note} {marker}")
+    w()
 
     # --- DATA TYPES ---
-    lines.append("DATA TYPES:")
+    w("DATA TYPES:")
     for col, info in type_info.items():
         mark = "[OK]" if info["correct"] else "[FAIL]"
         note = f"  [{info['note']}]" if info["note"] else ""
-        lines.append(
-            f"  - {col}: {info['detected'].upper()} {mark}{note}"
-        )
-    lines.append("")
+        w(f"  - {col}: {info['detected'].upper()} {mark}{note}")
+    w()
 
     # --- FORMAT ISSUES ---
-    lines.append("FORMAT ISSUES:")
-    lines.append("  Phone formats detected:")
+    w("FORMAT ISSUES:")
+    w("  Phone formats detected:")
     for fmt, examples in phone_formats.items():
         ex = examples[:2]
-        lines.append(f"    - {fmt}: {len(examples)} row(s) — e.g. {ex}")
-    lines.append("")
+        w(f"    - {fmt}: {len(examples)} row(s) — e.g. {ex}")
+    w()
     for col, fmt_map in date_formats.items():
-        lines.append(f"  Date formats in '{col}':")
+        w(f"  Date formats in '{col}':")
         for fmt, examples in fmt_map.items():
             ex = examples[:2]
-            lines.append(f"    - {fmt}: {len(examples)} row(s) — e.g. {ex}")
-    lines.append("")
+            w(f"    - {fmt}: {len(examples)} row(s) — e.g. {ex}")
+    w()
 
     # --- UNIQUENESS ---
-    lines.append("UNIQUENESS:")
+    w("UNIQUENESS:")
     if uniqueness["is_unique"]:
-        lines.append("  - customer_id: UNIQUE [OK]")
+        w("  - customer_id: UNIQUE [OK]")
     else:
-        lines.append(
+        w(
             f"  - customer_id: NOT UNIQUE [FAIL] "
             f"({uniqueness['duplicate_count']} duplicate row(s) found)"
         )
-        lines.append(f"    Duplicated IDs: {uniqueness['duplicated_ids']}")
-        lines.append(f"    Affected rows: {uniqueness['duplicated_rows']}")
-    lines.append("")
+        w(f"    Duplicated IDs: {uniqueness['duplicated_ids']}")
+        w(f"    Affected rows: {uniqueness['duplicated_row_numbers']}")
+    w()
     
     
 
@@ -484,20 +675,18 @@ def build_report(
     for fmt, examples in phone_formats.items():
         if fmt not in ("XXX-XXX-XXXX",):
             for ex in examples:
-                row_mask = df["phone"].astype(str).str.strip() == ex
-                row_nums = [i + 2 for i in df.index[row_mask].tolist()]
                 all_issues.append({
                     "type": "non_standard_phone_format",
                     "column": "phone",
-                    "row": row_nums[0] if row_nums else "?",
+                    "row": phone_first_rows.get(ex, "?"),
                     "value": ex,
                     "severity": "Medium",
                 })
 
     if not all_issues:
-        lines.append("QUALITY ISSUES: None detected.")
+        w("QUALITY ISSUES: None detected.")
     else:
-        lines.append("QUALITY ISSUES:")
+        w("QUALITY ISSUES:")
         for i, issue in enumerate(all_issues, 1):
             desc = issue["type"].replace("_", " ").title()
             col = issue.get("column", "?")
@@ -507,11 +696,11 @@ def build_report(
             extra = ""
             if "age_years" in issue:
                 extra = f" (age ~{issue['age_years']} years)"
-            lines.append(
+            w(
                 f"  {i}. [{sev}] {desc} in '{col}', "
                 f"Row {row}: '{val}'{extra}"
             )
-    lines.append("")
+    w()
     
 
     # SEVERITY SUMMARY 
@@ -527,7 +716,7 @@ def build_report(
         if sev in severity_buckets:
             severity_buckets[sev].append(desc)
 
-    lines.append("SEVERITY:")
+    w("SEVERITY:")
     level_descs = {
         "Critical": "blocks processing",
         "High":     "data incorrect",
@@ -536,54 +725,131 @@ def build_report(
     for level in ("Critical", "High", "Medium"):
         bucket = severity_buckets[level]
         level_desc = level_descs[level]
-        lines.append(f"  - {level} ({level_desc}): {len(bucket)} issue(s)")
+        w(f"  - {level} ({level_desc}): {len(bucket)} issue(s)")
         for item in bucket:
-            lines.append(f"      * {item}")
-    lines.append("")
+            w(f"      * {item}")
+    w()
 
 
 
     # SUMMARY 
-    total_rows = len(df)
+    total_rows = n_rows
     rows_with_issues: set = set()
     for issue in all_issues:
         r = issue.get("row")
         if isinstance(r, int):
             rows_with_issues.add(r)
     # Also include rows with missing values
-    miss_rows = set()
-    for col, info in completeness.items():
-        if info["missing"] > 0:
-            blank_idx = df[df[col].apply(_is_blank)].index
-            for idx in blank_idx:
-                miss_rows.add(idx + 2)
-    if not uniqueness["is_unique"]:
-        for rec in uniqueness["duplicated_rows"]:
-            pass  # already counted in issues
-
-    all_problem_rows = rows_with_issues | miss_rows
+    all_problem_rows = rows_with_issues | blank_rows
     clean_rows = total_rows - len(all_problem_rows)
 
-    lines.append("SUMMARY:")
-    lines.append(f"  - Total rows: {total_rows}")
-    lines.append(f"  - Total columns: {len(df.columns)}")
-    lines.append(
+    w("SUMMARY:")
+    w(f"  - Total rows: {total_rows}")
+    w(f"  - Total columns: {n_cols}")
+    w(
         f"  - Rows with at least one issue: {len(all_problem_rows)} "
         f"({round(len(all_problem_rows)/total_rows*100, 1)}%)"
     )
-    lines.append(
+    w(
         f"  - Clean rows: {max(0, clean_rows)} "
         f"({round(max(0, clean_rows)/total_rows*100, 1)}%)"
     )
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]  # no trailing newline, as with "\n".join
+
+
+def load_raw_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Load a CSV with every column as text and empty cells as missing.
+
+    Uses pyarrow's CSV reader when available, which marks empty cells null
+    while parsing and yields Arrow-backed string columns directly; otherwise
+    falls back to pandas plus a vectorised empty-string -> NA mask.
+
+    Parameters
+    ----------
+    csv_path : str
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if not HAS_PYARROW:
+        df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        # Empty strings -> NA so isna() works consistently; one 2-D compare
+        # and one masked assignment instead of replace's per-column pass
+        df[df.to_numpy(dtype=object) == ""] = pd.NA
+        return df
+
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    table = pa_csv.read_csv(
+        csv_path,
+        # Quoted cells may span lines (e.g. multi-line addresses)
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in header},
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+def write_findings_parquet(issues: List[Dict], output_dir: str = ".") -> Optional[str]:
+    """
+    Write the row-level issues table to findings.parquet.
+
+    The low-cardinality type/column/severity fields are stored
+    dictionary-encoded and the file is ZSTD-compressed, so downstream
+    stages can reload findings without re-parsing the text report.
+
+    Parameters
+    ----------
+    issues : list of dict
+        Issue records as produced by the check_* functions.
+    output_dir : str
+        Directory to write findings.parquet into.
+
+    Returns
+    -------
+    str path of the written file, or None when pyarrow is not installed or
+    the table could not be built or written (the file is optional output).
+    """
+    if not HAS_PYARROW:
+        return None
+
+    # Cell values keep their source type (float income, pd.NA, ...) in the
+    # issue dicts; the schema stores them as text, None when missing
+    records = [
+        {**issue, "value": None if pd.isna(issue.get("value")) else str(issue["value"])}
+        for issue in issues
+    ]
+
+    category = pa.dictionary(pa.int32(), pa.string())
+    schema = pa.schema([
+        ("type",      category),
+        ("column",    category),
+        ("row",       pa.int64()),
+        ("value",     pa.string()),
+        ("severity",  category),
+        ("age_years", pa.float64()),  # extreme_age rows only
+    ])
+    out_path = os.path.join(output_dir, "findings.parquet")
+    try:
+        table = pa.Table.from_pylist(records, schema=schema)
+        pq.write_table(table, out_path, compression="zstd", use_dictionary=True)
+    except pa.ArrowException:
+        return None
+    return out_path
 
 
 def run_quality_analysis(
-    df: pd.DataFrame, output_dir: str = "."
+    df: pd.DataFrame, output_dir: str = ".", parallel: bool = False
 ) -> Tuple[str, Dict]:
     """
-    Run the full data quality analysis and write data_quality_report.txt.
+    Run the full data quality analysis and write data_quality_report.txt
+    (plus findings.parquet when pyarrow is available).
 
     Parameters
     ----------
@@ -591,6 +857,11 @@ def run_quality_analysis(
         Raw data loaded as strings (dtype=object).
     output_dir : str
         Directory to write the report file into.
+    parallel : bool
+        Run the independent column scans (row masks, phone formats, date
+        formats, uniqueness) on a thread pool. The pandas string and regex
+        kernels release the GIL for much of their work, so this helps on
+        large inputs; results are identical either way.
 
     Returns
     -------
@@ -598,23 +869,32 @@ def run_quality_analysis(
         report_text : str – full formatted report
         findings_dict : dict – structured findings for downstream use
     """
-    completeness = check_completeness(df)
+    scans = (_compute_masks, detect_phone_formats, detect_date_formats, check_uniqueness)
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(scans)) as pool:
+            futures = [pool.submit(scan, df) for scan in scans]
+            masks, phone_formats, date_formats, uniqueness = (
+                f.result() for f in futures
+            )
+    else:
+        masks, phone_formats, date_formats, uniqueness = (scan(df) for scan in scans)
+
+    completeness = check_completeness(df, masks)
     type_info = check_data_types(df)
-    phone_formats = detect_phone_formats(df)
-    date_formats = detect_date_formats(df)
-    uniqueness = check_uniqueness(df)
-    invalid_vals = check_invalid_values(df)
-    status_issues = check_account_status(df)
-    name_issues = check_name_casing(df)
+    invalid_vals = check_invalid_values(df, masks)
+    status_issues = check_account_status(df, masks)
+    name_issues = check_name_casing(df, masks)
 
     report = build_report(
         completeness, type_info, phone_formats, date_formats,
-        uniqueness, invalid_vals, status_issues, name_issues, df
+        uniqueness, invalid_vals, status_issues, name_issues, df,
+        blank_row_mask=masks["any_blank"],
     )
 
     out_path = os.path.join(output_dir, "data_quality_report.txt")
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(report)
+    write_findings_parquet(invalid_vals + status_issues + name_issues, output_dir)
 
     findings = {
         "completeness": completeness,
@@ -625,6 +905,7 @@ def run_quality_analysis(
         "invalid_vals": invalid_vals,
         "status_issues": status_issues,
         "name_issues": name_issues,
+        "blank_row_mask": masks["any_blank"],
     }
     return report, findings
 
@@ -632,16 +913,13 @@ def run_quality_analysis(
 
 
 
-
 # Standalone entry point
 if __name__ == "__main__":
     import sys
 
     csv_path = sys.argv[1] if len(sys.argv) > 1 else "customers_raw.csv"
     print(f"[Part 1] Loading '{csv_path}' ...")
-    raw_df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
-    # Replace empty strings with NaN so isna() works consistently
-    raw_df.replace("", pd.NA, inplace=True)
+    raw_df = load_raw_csv(csv_path)
     print(f"[Part 1] Loaded {len(raw_df)} rows × {len(raw_df.columns)} columns.")
 
     report_text, _ = run_quality_analysis(raw_df, output_dir=".")
@@ -12,8 +12,14 @@ and can also be executed standalone via __main__.
 
 import re
 import os
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from common import (
+    REPORT_BUFFER_SIZE, normalize_text, regex_text, write_lines,
+)
+
 
 
 
@@ -31,6 +37,25 @@ PII_COLUMNS: Dict[str, Dict] = {
 
 NON_PII_COLUMNS: List[str] = ["customer_id", "account_status", "created_date"]
 
+HIGH_PII_COLUMNS: Tuple[str, ...] = tuple(
+    c for c, m in PII_COLUMNS.items() if m["risk"] == "HIGH"
+)
+MEDIUM_PII_COLUMNS: Tuple[str, ...] = tuple(
+    c for c, m in PII_COLUMNS.items() if m["risk"] == "MEDIUM"
+)
+
+# DETECTED PII section: one line per PII type, in report order
+DETECTED_PII_LINE = "  - {label:<22}{count:>3} out of {total} rows ({pct})"
+DETECTED_PII_LABELS: Tuple[str, ...] = (
+    "Emails found:", "Phone numbers found:", "Addresses found:",
+    "Dates of birth found:", "Names found:", "Income data found:",
+)
+
+# Column order of the row inventory matrix, and the labels reported per row
+PII_TYPE_LABELS: Tuple[str, ...] = (
+    "Name (first/last)", "Email", "Phone", "Address", "Date of Birth", "Income",
+)
+
 # Regex patterns for dynamic PII detection within cell values
 EMAIL_PATTERN = re.compile(
     r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", re.IGNORECASE
@@ -57,6 +82,17 @@ DATE_PATTERN = re.compile(
 
 # Detection functions
 
+def _present_mask(series: pd.Series) -> np.ndarray:
+    """Boolean array, True where the cell is non-null and not blank."""
+    return normalize_text(series).notna().to_numpy()
+
+
+def _pattern_mask(series: pd.Series, pattern: "re.Pattern") -> np.ndarray:
+    """Boolean array, True where the stripped cell contains a pattern match."""
+    found = regex_text(normalize_text(series)).str.contains(pattern, na=False)
+    return found.to_numpy(dtype=bool)
+
+
 def detect_email_pii(df: pd.DataFrame) -> List[int]:
     """
     Find row indices where the email column contains a valid email address.
@@ -69,12 +105,7 @@ def detect_email_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: List[int] = []
-    for idx, val in df["email"].items():
-        v = str(val).strip()
-        if v and EMAIL_PATTERN.search(v):
-            found.append(int(idx))
-    return found
+    return np.flatnonzero(_pattern_mask(df["email"], EMAIL_PATTERN)).tolist()
 
 
 def detect_phone_pii(df: pd.DataFrame) -> List[int]:
@@ -89,12 +120,7 @@ def detect_phone_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: List[int] = []
-    for idx, val in df["phone"].items():
-        v = str(val).strip()
-        if v and PHONE_PATTERN.search(v):
-            found.append(int(idx))
-    return found
+    return np.flatnonzero(_pattern_mask(df["phone"], PHONE_PATTERN)).tolist()
 
 
 def detect_address_pii(df: pd.DataFrame) -> List[int]:
@@ -109,12 +135,7 @@ def detect_address_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: List[int] = []
-    for idx, val in df["address"].items():
-        v = str(val).strip()
-        if v and not pd.isna(val):
-            found.append(int(idx))
-    return found
+    return np.flatnonzero(_present_mask(df["address"])).tolist()
 
 
 def detect_dob_pii(df: pd.DataFrame) -> List[int]:
@@ -129,12 +150,7 @@ def detect_dob_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: List[int] = []
-    for idx, val in df["date_of_birth"].items():
-        v = str(val).strip()
-        if v and not pd.isna(val):
-            found.append(int(idx))
-    return found
+    return np.flatnonzero(_present_mask(df["date_of_birth"])).tolist()
 
 
 def detect_name_pii(df: pd.DataFrame) -> List[int]:
@@ -149,13 +165,8 @@ def detect_name_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: Set[int] = set()
-    for col in ("first_name", "last_name"):
-        for idx, val in df[col].items():
-            v = str(val).strip()
-            if v and not pd.isna(val):
-                found.add(int(idx))
-    return sorted(found)
+    mask = _present_mask(df["first_name"]) | _present_mask(df["last_name"])
+    return np.flatnonzero(mask).tolist()
 
 
 def detect_income_pii(df: pd.DataFrame) -> List[int]:
@@ -170,12 +181,7 @@ def detect_income_pii(df: pd.DataFrame) -> List[int]:
     -------
     list of int row indices (0-based).
     """
-    found: List[int] = []
-    for idx, val in df["income"].items():
-        v = str(val).strip()
-        if v and not pd.isna(val):
-            found.append(int(idx))
-    return found
+    return np.flatnonzero(_present_mask(df["income"])).tolist()
 
 
 def build_row_pii_inventory(
@@ -186,7 +192,7 @@ def build_row_pii_inventory(
     dob_rows: List[int],
     name_rows: List[int],
     income_rows: List[int],
-) -> Dict[int, List[str]]:
+) -> np.ndarray:
     """
     Build a per-row inventory of PII types present.
 
@@ -197,25 +203,40 @@ def build_row_pii_inventory(
 
     Returns
     -------
-    dict mapping 0-based row index -> list of PII type labels.
+    np.ndarray
+        uint8 matrix of shape (rows, len(PII_TYPE_LABELS)); entry [i, j] is
+        1 when row i contains PII_TYPE_LABELS[j].
     """
-    inventory: Dict[int, List[str]] = {i: [] for i in range(len(df))}
-    for idx in name_rows:
-        inventory[idx].append("Name (first/last)")
-    for idx in email_rows:
-        inventory[idx].append("Email")
-    for idx in phone_rows:
-        inventory[idx].append("Phone")
-    for idx in address_rows:
-        inventory[idx].append("Address")
-    for idx in dob_rows:
-        inventory[idx].append("Date of Birth")
-    for idx in income_rows:
-        inventory[idx].append("Income")
+    inventory = np.zeros((len(df), len(PII_TYPE_LABELS)), dtype=np.uint8)
+    by_type = (name_rows, email_rows, phone_rows, address_rows, dob_rows, income_rows)
+    for j, rows in enumerate(by_type):
+        inventory[rows, j] = 1
     return inventory
 
 
-def build_report(
+def inventory_to_dict(inventory: np.ndarray) -> Dict[int, List[str]]:
+    """
+    Expand a row inventory matrix into {row index: [PII type labels]}.
+
+    Only rows with at least one PII type get an entry; look rows up with
+    .get(i, []) to treat absent rows as "No PII detected".
+
+    Parameters
+    ----------
+    inventory : np.ndarray
+        Output of build_row_pii_inventory.
+
+    Returns
+    -------
+    dict mapping 0-based row index -> list of PII type labels.
+    """
+    return {
+        i: [PII_TYPE_LABELS[j] for j in np.flatnonzero(inventory[i])]
+        for i in np.flatnonzero(inventory.any(axis=1)).tolist()
+    }
+
+
+def _report_lines(
     df: pd.DataFrame,
     email_rows: List[int],
     phone_rows: List[int],
@@ -223,105 +244,138 @@ def build_report(
     dob_rows: List[int],
     name_rows: List[int],
     income_rows: List[int],
-    row_inventory: Dict[int, List[str]],
-) -> str:
+    row_inventory: np.ndarray,
+) -> Iterator[str]:
     """
-    Assemble PII detection findings into a formatted report string.
+    Yield the PII detection report line by line.
 
     Parameters
     ----------
     df : pd.DataFrame
     *_rows : lists of row indices
-    row_inventory : per-row PII type list
+    row_inventory : per-row PII presence matrix (build_row_pii_inventory)
 
-    Returns
-    -------
-    str
+    Yields
+    ------
+    str, one report line (a few span several physical lines).
     """
     total = len(df)
-    lines: List[str] = []
-    lines.append("PII DETECTION REPORT")
-    lines.append("")
+    yield "PII DETECTION REPORT"
+    yield ""
 
     # RISK ASSESSMENT 
-    lines.append("RISK ASSESSMENT:")
-    high_pii = [c for c, m in PII_COLUMNS.items() if m["risk"] == "HIGH"]
-    med_pii  = [c for c, m in PII_COLUMNS.items() if m["risk"] == "MEDIUM"]
-    lines.append(
-        f"  - HIGH: {', '.join(high_pii)}\n"
+    yield "RISK ASSESSMENT:"
+    yield (
+        f"  - HIGH: {', '.join(HIGH_PII_COLUMNS)}\n"
         f"    (Direct identifiers — names, contact details, DOB, address\n"
         f"     combine to uniquely identify and locate any individual.)"
     )
-    lines.append(
-        f"  - MEDIUM: {', '.join(med_pii)}\n"
+    yield (
+        f"  - MEDIUM: {', '.join(MEDIUM_PII_COLUMNS)}\n"
         f"    (Financial sensitivity — income reveals economic status\n"
         f"     and is protected under many privacy regulations.)"
     )
-    lines.append("")
+    yield ""
 
     # DETECTED PII 
     def pct(n: int) -> str:
         return f"{round(n / total * 100, 1)}%"
 
-    lines.append("DETECTED PII:")
-    lines.append(f"  - Emails found:         {len(email_rows):>3} out of {total} rows ({pct(len(email_rows))})")
-    lines.append(f"  - Phone numbers found:  {len(phone_rows):>3} out of {total} rows ({pct(len(phone_rows))})")
-    lines.append(f"  - Addresses found:      {len(address_rows):>3} out of {total} rows ({pct(len(address_rows))})")
-    lines.append(f"  - Dates of birth found: {len(dob_rows):>3} out of {total} rows ({pct(len(dob_rows))})")
-    lines.append(f"  - Names found:          {len(name_rows):>3} out of {total} rows ({pct(len(name_rows))})")
-    lines.append(f"  - Income data found:    {len(income_rows):>3} out of {total} rows ({pct(len(income_rows))})")
-    lines.append("")
+    yield "DETECTED PII:"
+    by_type = (email_rows, phone_rows, address_rows, dob_rows, name_rows, income_rows)
+    for label, rows in zip(DETECTED_PII_LABELS, by_type):
+        yield DETECTED_PII_LINE.format(
+            label=label, count=len(rows), total=total, pct=pct(len(rows))
+        )
+    yield ""
 
     # PII BY ROW 
-    lines.append("PII BY ROW:")
-    for i in range(total):
-        row_num = i + 2   # human-readable: header is row 1
-        cust_id = str(df.iloc[i]["customer_id"]).strip()
-        pii_types = row_inventory[i]
-        if pii_types:
-            lines.append(f"  - Row {row_num:>2} (ID={cust_id}): {', '.join(pii_types)}")
-        else:
-            lines.append(f"  - Row {row_num:>2} (ID={cust_id}): No PII detected")
-    lines.append("")
+    yield "PII BY ROW:"
+    # human-readable row numbers: header is row 1
+    cust_ids = (str(v).strip() for v in df["customer_id"])
+    # Each row's bits packed into one code; label text built once per code
+    codes = row_inventory.astype(np.int64) @ (1 << np.arange(len(PII_TYPE_LABELS)))
+    code_text = {
+        code: ", ".join(
+            label for j, label in enumerate(PII_TYPE_LABELS) if code >> j & 1
+        ) or "No PII detected"
+        for code in np.unique(codes).tolist()
+    }
+    yield from (
+        f"  - Row {i + 2:>2} (ID={cust_id}): {code_text[code]}"
+        for i, (cust_id, code) in enumerate(zip(cust_ids, codes.tolist()))
+    )
+    yield ""
 
 
     # COLUMN PII CLASSIFICATION 
-    lines.append("COLUMN PII CLASSIFICATION:")
-    lines.append(f"  {'Column':<20} {'Category':<22} {'Risk'}")
-    lines.append(f"  {'-'*20} {'-'*22} {'-'*6}")
+    yield "COLUMN PII CLASSIFICATION:"
+    yield f"  {'Column':<20} {'Category':<22} {'Risk'}"
+    yield f"  {'-'*20} {'-'*22} {'-'*6}"
     for col, meta in PII_COLUMNS.items():
-        lines.append(f"  {col:<20} {meta['category']:<22} {meta['risk']}")
+        yield f"  {col:<20} {meta['category']:<22} {meta['risk']}"
     for col in NON_PII_COLUMNS:
-        lines.append(f"  {col:<20} {'Non-PII':<22} {'NONE'}")
-    lines.append("")
+        yield f"  {col:<20} {'Non-PII':<22} {'NONE'}"
+    yield ""
 
     # EXPOSURE RISK 
-    lines.append("EXPOSURE RISK:")
-    lines.append("  If this dataset were breached, attackers could:")
-    lines.append("  - Phish customers (have full email addresses)")
-    lines.append("  - Spoof identities (have names + DOB + address)")
-    lines.append("  - Social engineer targets (have phone numbers)")
-    lines.append("  - Financial profiling (have income levels)")
-    lines.append(
-        f"  - At-risk individuals: ALL {total} customers "
-        f"({pct(total)} of dataset)"
+    yield "EXPOSURE RISK:"
+    yield "  If this dataset were breached, attackers could:"
+    yield "  - Phish customers (have full email addresses)"
+    yield "  - Spoof identities (have names + DOB + address)"
+    yield "  - Social engineer targets (have phone numbers)"
+    yield "  - Financial profiling (have income levels)"
+    at_risk = int(row_inventory.any(axis=1).sum())
+    yield (
+        f"  - At-risk individuals: {'ALL ' if at_risk == total else ''}{at_risk} customers "
+        f"({pct(at_risk)} of dataset)"
     )
-    lines.append("")
+    yield ""
 
     # MITIGATION 
-    lines.append(
+    yield (
         "MITIGATION: Mask all PII before sharing with analytics teams.\n"
         "  Apply column-level masking (names, emails, phones, addresses, DOBs).\n"
         "  Retain only customer_id, income, account_status, created_date for\n"
         "  analytics purposes — or tokenise income into brackets."
     )
 
-    return "\n".join(lines)
+
+def build_report(
+    df: pd.DataFrame,
+    email_rows: List[int],
+    phone_rows: List[int],
+    address_rows: List[int],
+    dob_rows: List[int],
+    name_rows: List[int],
+    income_rows: List[int],
+    row_inventory: np.ndarray,
+) -> str:
+    """
+    Assemble PII detection findings into a formatted report string.
+
+    run_pii_detection streams the same lines straight to its report file;
+    this joins them for callers that want the text.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    *_rows : lists of row indices
+    row_inventory : per-row PII presence matrix (build_row_pii_inventory)
+
+    Returns
+    -------
+    str
+    """
+    return "\n".join(_report_lines(
+        df, email_rows, phone_rows, address_rows,
+        dob_rows, name_rows, income_rows, row_inventory
+    ))
 
 
 def run_pii_detection(
-    df: pd.DataFrame, output_dir: str = "."
-) -> Tuple[str, Dict]:
+    df: pd.DataFrame, output_dir: str = ".", keep_text: bool = True
+) -> Tuple[Optional[str], Dict]:
     """
     Run PII detection and write pii_detection_report.txt.
 
@@ -331,10 +385,14 @@ def run_pii_detection(
         Raw data (dtype=object / string columns).
     output_dir : str
         Directory for the output report file.
+    keep_text : bool
+        Also return the report text. When False the report is streamed to
+        the file line by line and never held in memory as a whole.
 
     Returns
     -------
     (report_text, findings_dict)
+        report_text is None when keep_text is False.
     """
     email_rows   = detect_email_pii(df)
     phone_rows   = detect_phone_pii(df)
@@ -348,14 +406,19 @@ def run_pii_detection(
         dob_rows, name_rows, income_rows
     )
 
-    report = build_report(
+    lines = _report_lines(
         df, email_rows, phone_rows, address_rows,
         dob_rows, name_rows, income_rows, row_inventory
     )
 
     out_path = os.path.join(output_dir, "pii_detection_report.txt")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(report)
+    with open(out_path, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        if keep_text:
+            report = "\n".join(lines)
+            f.write(report)
+        else:
+            report = None
+            write_lines(lines, f)
 
     findings = {
         "email_rows":    email_rows,
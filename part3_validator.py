@@ -14,11 +14,28 @@ and can also be executed standalone via __main__.
 
 import re
 import os
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime, date
-from typing import Dict, List, Tuple, Any
+from datetime import date
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Any
+
+from common import (
+    REPORT_BUFFER_SIZE, normalize_text, parse_dates, parse_floats,
+    regex_text, write_lines,
+)
+
+
 
 
+class Failure(NamedTuple):
+    """One rule violation: 1-based CSV row, column, offending value, rule text."""
+    row: int
+    column: str
+    value: Any
+    rule: str
+
 
 # Validation rules registry
 # Each entry: (rule_name, checker_function_name)
@@ -31,36 +48,89 @@ EMAIL_REGEX = re.compile(
 VALID_STATUSES = {"active", "inactive", "suspended"}
 NAME_REGEX = re.compile(r"^[A-Za-z\s'\-]{2,50}$")
 
-
-def _parse_date(val: Any) -> Tuple[bool, Any]:
+DATE_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y")
+
+# Report order of the validated columns, and the rules summarised for each
+COLUMN_ORDER: List[str] = [
+    "customer_id", "first_name", "last_name", "email", "phone",
+    "date_of_birth", "created_date", "address", "income", "account_status"
+]
+
+RULE_DESCRIPTIONS: Dict[str, str] = {
+    "customer_id":    "Positive int, unique",
+    "first_name":     "Non-empty, 2-50 chars, letters only",
+    "last_name":      "Non-empty, 2-50 chars, letters only",
+    "email":          "Valid email format",
+    "phone":          "10-15 digits when stripped",
+    "date_of_birth":  "Valid date, age 0-150 years",
+    "created_date":   "Valid date, not in future",
+    "address":        "Non-empty string",
+    "income":         "Non-negative, <= $10M",
+    "account_status": "active|inactive|suspended",
+}
+
+# Columns whose rules only look at their own row (everything but the
+# customer_id uniqueness check), so a uniform column can be judged by its
+# first rows (see _validate_uniform)
+ROW_LOCAL_COLUMNS: List[str] = [c for c in COLUMN_ORDER if c != "customer_id"]
+
+# run_all_validators uses a thread pool above this many rows by default
+PARALLEL_MIN_ROWS = 10_000
+
+# Leading rows _validate_uniform compares before scanning the whole column,
+# so a column that is not uniform (the usual case) is rejected cheaply
+UNIFORM_PROBE_ROWS = 64
+
+
+
+def _collect_failures(
+    series: pd.Series,
+    col_name: str,
+    checks: Sequence[Tuple[np.ndarray, str, Optional[np.ndarray]]],
+) -> List[Failure]:
     """
-    Attempt to parse val as a date using common formats.
+    Turn boolean rule masks into Failure records.
 
     Parameters
     ----------
-    val : any
+    series : pd.Series
+        Column as passed to the validator (its values are reported as-is).
+    col_name : str
+    checks : list of (mask, rule, params)
+        rule is formatted with params[i] for each failing row i when params
+        is given. A row failing several checks gets one record per check, in
+        check order.
 
     Returns
     -------
-    (success: bool, parsed_date or None)
+    list of Failure records, in row order.
     """
-    if pd.isna(val) or str(val).strip() == "":
-        return False, None
-    v = str(val).strip()
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-        try:
-            return True, datetime.strptime(v, fmt).date()
-        except ValueError:
-            pass
-    return False, None
+    hits = [np.flatnonzero(mask) for mask, _, _ in checks]
+    pos = np.concatenate(hits) if hits else np.empty(0, dtype=np.intp)
+    which = np.concatenate([np.full(len(h), k) for k, h in enumerate(hits)]) if hits else pos
+    order = np.lexsort((which, pos))
+    pos, which = pos[order], which[order]
+
+    # Rule text per failure, filled one check at a time; fixed rules are a
+    # single broadcast, only parametrised ones format per failing row.
+    rules = np.empty(len(pos), dtype=object)
+    for k, (_, rule, params) in enumerate(checks):
+        selected = which == k
+        if params is None:
+            rules[selected] = rule
+        else:
+            rules[selected] = [rule.format(p) for p in params[pos[selected]].tolist()]
 
+    rows = (series.index.to_numpy()[pos] + 2).tolist()
+    values = series.to_numpy(dtype=object)[pos].tolist()
+    return list(map(Failure, rows, repeat(col_name), values, rules.tolist()))
 
 
 # Per-column validators
 
 def validate_customer_id(
-    series: pd.Series, df: pd.DataFrame
-) -> List[Dict]:
+    series: pd.Series, df: pd.DataFrame, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate customer_id: must be a positive integer, must be unique.
 
@@ -68,54 +138,43 @@ def validate_customer_id(
     ----------
     series : pd.Series  (customer_id column)
     df : pd.DataFrame
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts with keys: row, column, value, rule.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    seen_ids: Dict[str, int] = {}
-
-    for idx, val in series.items():
-        row = int(idx) + 2
-        v = str(val).strip() if not pd.isna(val) else ""
-
-        # Must be a positive integer
-        if not v:
-            failures.append({
-                "row": row, "column": "customer_id",
-                "value": val, "rule": "Must be a positive integer (missing)"
-            })
-            continue
-        try:
-            num = int(float(v))
-            if num <= 0:
-                failures.append({
-                    "row": row, "column": "customer_id",
-                    "value": val, "rule": "Must be a positive integer (value <= 0)"
-                })
-                continue
-        except (ValueError, TypeError):
-            failures.append({
-                "row": row, "column": "customer_id",
-                "value": val, "rule": "Must be a positive integer (non-numeric)"
-            })
-            continue
-
-        # Uniqueness check
-        if v in seen_ids:
-            failures.append({
-                "row": row, "column": "customer_id",
-                "value": val,
-                "rule": f"Must be unique (duplicate of row {seen_ids[v]})"
-            })
-        else:
-            seen_ids[v] = row
-
-    return failures
-
-
-def validate_name(series: pd.Series, col_name: str) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    nums, _ = parse_floats(stripped)
+    non_numeric = ~missing & ~np.isfinite(nums)  # int() rejects nan and inf
+    non_positive = np.trunc(nums) <= 0  # int(float(v)) <= 0
+
+    # Uniqueness among the well-formed ids, keyed on the stripped text;
+    # each duplicate points back at the first row carrying that id.
+    valid = np.flatnonzero(~missing & ~non_numeric & ~non_positive)
+    codes, _ = pd.factorize(stripped.to_numpy(dtype=object)[valid])
+    _, first_seen = np.unique(codes, return_index=True)
+    first = valid[first_seen[codes]]
+    duplicate = np.zeros(len(series), dtype=bool)
+    duplicate[valid[valid != first]] = True
+    first_row = np.zeros(len(series), dtype=np.int64)
+    first_row[valid] = series.index.to_numpy()[first] + 2
+
+    return _collect_failures(series, "customer_id", [
+        (missing,      "Must be a positive integer (missing)", None),
+        (non_positive, "Must be a positive integer (value <= 0)", None),
+        (non_numeric,  "Must be a positive integer (non-numeric)", None),
+        (duplicate,    "Must be unique (duplicate of row {})", first_row),
+    ])
+
+
+def validate_name(
+    series: pd.Series, col_name: str, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate a name column: non-null, 2–50 chars, letters/hyphens/apostrophes.
 
@@ -123,99 +182,87 @@ def validate_name(series: pd.Series, col_name: str) -> List[Dict]:
     ----------
     series : pd.Series
     col_name : str
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val, "rule": "Must be non-empty"
-            })
-            continue
-        v = str(val).strip()
-        if not (2 <= len(v) <= 50):
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val, "rule": "Length must be between 2 and 50 characters"
-            })
-        if not NAME_REGEX.match(v):
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val,
-                "rule": "Must contain only letters, spaces, hyphens, or apostrophes"
-            })
-    return failures
-
-
-def validate_email(series: pd.Series) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    bad_length = ~missing & ~stripped.str.len().between(2, 50).to_numpy(dtype=bool, na_value=False)
+    bad_chars = ~missing & ~regex_text(stripped).str.match(NAME_REGEX, na=False).to_numpy(dtype=bool)
+    return _collect_failures(series, col_name, [
+        (missing,    "Must be non-empty", None),
+        (bad_length, "Length must be between 2 and 50 characters", None),
+        (bad_chars,  "Must contain only letters, spaces, hyphens, or apostrophes", None),
+    ])
+
+
+def validate_email(
+    series: pd.Series, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate email: must match standard email format.
 
     Parameters
     ----------
     series : pd.Series
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": "email",
-                "value": val, "rule": "Must be non-empty"
-            })
-            continue
-        v = str(val).strip()
-        if not EMAIL_REGEX.match(v):
-            failures.append({
-                "row": row, "column": "email",
-                "value": val, "rule": "Must be a valid email address format"
-            })
-    return failures
-
-
-def validate_phone(series: pd.Series) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    bad_format = ~missing & ~regex_text(stripped).str.match(EMAIL_REGEX, na=False).to_numpy(dtype=bool)
+    return _collect_failures(series, "email", [
+        (missing,    "Must be non-empty", None),
+        (bad_format, "Must be a valid email address format", None),
+    ])
+
+
+def validate_phone(
+    series: pd.Series, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate phone: when stripped of all non-digit chars, must be 10–15 digits.
 
     Parameters
     ----------
     series : pd.Series
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": "phone",
-                "value": val, "rule": "Must be non-empty"
-            })
-            continue
-        digits_only = re.sub(r"\D", "", str(val))
-        if not (10 <= len(digits_only) <= 15):
-            failures.append({
-                "row": row, "column": "phone",
-                "value": val,
-                "rule": f"Stripped digit count must be 10–15 (got {len(digits_only)})"
-            })
-    return failures
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    digit_counts = regex_text(stripped).str.count(r"\d").to_numpy(dtype=float, na_value=np.nan)
+    bad_count = ~missing & ~((digit_counts >= 10) & (digit_counts <= 15))
+    return _collect_failures(series, "phone", [
+        (missing,   "Must be non-empty", None),
+        (bad_count, "Stripped digit count must be 10–15 (got {:.0f})", digit_counts),
+    ])
 
 
 def validate_date_column(
-    series: pd.Series, col_name: str, allow_future: bool = False
-) -> List[Dict]:
+    series: pd.Series,
+    col_name: str,
+    allow_future: bool = False,
+    stripped: Optional[pd.Series] = None,
+) -> List[Failure]:
     """
     Validate a date column: must be parseable, not in the future (unless allowed),
     and for date_of_birth the age must be 0–150 years.
@@ -225,292 +272,320 @@ def validate_date_column(
     series : pd.Series
     col_name : str
     allow_future : bool  – if False, future dates are flagged.
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    today = date.today()
-
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            # Missing is OK here (completeness handles it); skip
-            continue
-        v = str(val).strip()
-
-        # Literal "invalid_date"
-        if v.lower() == "invalid_date":
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val, "rule": "Not a valid date (literal 'invalid_date' string)"
-            })
-            continue
-
-        ok, parsed = _parse_date(v)
-        if not ok:
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val, "rule": "Could not be parsed as a valid date"
-            })
-            continue
-
-        if not allow_future and parsed > today:
-            failures.append({
-                "row": row, "column": col_name,
-                "value": val, "rule": "Date must not be in the future"
-            })
-
-        # Age range for date_of_birth
-        if col_name == "date_of_birth":
-            age = (today - parsed).days / 365.25
-            if age > 150:
-                failures.append({
-                    "row": row, "column": col_name,
-                    "value": val,
-                    "rule": f"Date of birth implies age > 150 years (~{age:.1f} years)"
-                })
-            elif age < 0:
-                failures.append({
-                    "row": row, "column": col_name,
-                    "value": val, "rule": "Date of birth is in the future"
-                })
-
-    return failures
-
-
-def validate_address(series: pd.Series) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()  # missing is OK here (completeness handles it)
+    literal = stripped.str.lower().eq("invalid_date").to_numpy(dtype=bool, na_value=False)
+    days = parse_dates(stripped, DATE_FORMATS)
+    known = ~np.isnat(days)
+    today = np.datetime64(date.today(), "D")
+
+    checks = [
+        (literal, "Not a valid date (literal 'invalid_date' string)", None),
+        (~missing & ~literal & ~known, "Could not be parsed as a valid date", None),
+    ]
+    if not allow_future:
+        checks.append((days > today, "Date must not be in the future", None))
+
+    # Age range for date_of_birth
+    if col_name == "date_of_birth":
+        age = np.where(known, (today - days).astype("int64") / 365.25, np.nan)
+        checks.append((
+            age > 150,
+            "Date of birth implies age > 150 years (~{:.1f} years)", age,
+        ))
+        checks.append((age < 0, "Date of birth is in the future", None))
+
+    return _collect_failures(series, col_name, checks)
+
+
+def validate_address(
+    series: pd.Series, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate address: must be non-null and non-empty string.
 
     Parameters
     ----------
     series : pd.Series
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": "address",
-                "value": val, "rule": "Must be non-empty"
-            })
-    return failures
-
-
-def validate_income(series: pd.Series) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    return _collect_failures(series, "address", [
+        (missing, "Must be non-empty", None),
+    ])
+
+
+def validate_income(
+    series: pd.Series, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate income: must be numeric, non-negative, and ≤ $10,000,000.
 
     Parameters
     ----------
     series : pd.Series
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": "income",
-                "value": val, "rule": "Must be non-empty numeric value"
-            })
-            continue
-        try:
-            num = float(str(val).strip())
-        except (ValueError, TypeError):
-            failures.append({
-                "row": row, "column": "income",
-                "value": val, "rule": "Must be a numeric value"
-            })
-            continue
-        if num < 0:
-            failures.append({
-                "row": row, "column": "income",
-                "value": val, "rule": "Income must be non-negative"
-            })
-        if num > 10_000_000:
-            failures.append({
-                "row": row, "column": "income",
-                "value": val, "rule": "Income exceeds $10,000,000 upper bound"
-            })
-    return failures
-
-
-def validate_account_status(series: pd.Series) -> List[Dict]:
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    nums, numeric = parse_floats(stripped)
+    return _collect_failures(series, "income", [
+        (missing,                       "Must be non-empty numeric value", None),
+        (~missing & ~numeric,           "Must be a numeric value", None),
+        (nums < 0,                      "Income must be non-negative", None),
+        (nums > 10_000_000,             "Income exceeds $10,000,000 upper bound", None),
+    ])
+
+
+def validate_account_status(
+    series: pd.Series, stripped: Optional[pd.Series] = None
+) -> List[Failure]:
     """
     Validate account_status: must be one of 'active', 'inactive', 'suspended'.
 
     Parameters
     ----------
     series : pd.Series
+    stripped : pd.Series, optional
+        series already passed through normalize_text; run_all_validators
+        computes it once per column and shares it.
 
     Returns
     -------
-    list of failure dicts.
+    list of Failure records.
     """
-    failures: List[Dict] = []
-    for idx, val in series.items():
-        row = int(idx) + 2
-        if pd.isna(val) or str(val).strip() == "":
-            failures.append({
-                "row": row, "column": "account_status",
-                "value": val,
-                "rule": "Must be one of: active, inactive, suspended (missing)"
-            })
-            continue
-        v = str(val).strip().lower()
-        if v not in VALID_STATUSES:
-            failures.append({
-                "row": row, "column": "account_status",
-                "value": val,
-                "rule": f"Must be one of: active, inactive, suspended (got '{val}')"
-            })
-    return failures
+    if stripped is None:
+        stripped = normalize_text(series)
+    missing = stripped.isna().to_numpy()
+    invalid = ~missing & ~stripped.str.lower().isin(VALID_STATUSES).to_numpy(dtype=bool)
+    return _collect_failures(series, "account_status", [
+        (missing, "Must be one of: active, inactive, suspended (missing)", None),
+        (invalid, "Must be one of: active, inactive, suspended (got '{}')",
+         series.to_numpy(dtype=object)),
+    ])
 
 
 
 # Main validation runner
 
-def run_all_validators(df: pd.DataFrame) -> Dict[str, List[Dict]]:
+def _validate_uniform(
+    series: pd.Series, stripped: pd.Series, validator, kwargs: Dict
+) -> Optional[List[Failure]]:
+    """
+    Fast path for a row-local validator on a column holding at most one
+    distinct value (plus missing cells), e.g. an all-NA or constant column.
+
+    The validator runs on one representative present row and one missing
+    row only; their rule results are then broadcast to every row of the
+    same kind. Returns None when the column is not uniform.
+    """
+    probe = stripped.iloc[:UNIFORM_PROBE_ROWS].dropna()
+    if len(probe) and not probe.eq(probe.iloc[0]).all():
+        return None
+
+    missing = stripped.isna().to_numpy()
+    present = np.flatnonzero(~missing)
+    if len(present):
+        first = stripped.iloc[present[0]]
+        if not stripped.iloc[present].eq(first).all():
+            return None
+        raw = series.to_numpy(dtype=object)[present]
+        if not (raw == raw[0]).all():  # same text, different padding
+            return None
+
+    reps = np.concatenate([present[:1], np.flatnonzero(missing)[:1]])
+    sample = series.iloc[reps].set_axis(pd.RangeIndex(len(reps)))
+    sample_failures = validator(
+        sample, stripped=stripped.iloc[reps].set_axis(sample.index), **kwargs
+    )
+    kind_masks = [~missing, missing] if len(present) else [missing]
+    checks = [
+        (kind_masks[f.row - 2], f.rule, None) for f in sample_failures
+    ]
+    return _collect_failures(series, sample_failures[0].column, checks) if checks else []
+
+
+def run_all_validators(
+    df: pd.DataFrame, parallel: Optional[bool] = None
+) -> Dict[str, List[Failure]]:
     """
     Run all validators and return failures grouped by column.
 
     Parameters
     ----------
     df : pd.DataFrame
+    parallel : bool, optional
+        Run the per-column validators on a thread pool. Each reads only its
+        own column and spends most of its time in pandas/Arrow kernels that
+        release the GIL. Defaults to True for frames larger than
+        PARALLEL_MIN_ROWS; results are identical either way.
 
     Returns
     -------
-    dict mapping column_name -> list of failure dicts.
+    dict mapping column_name -> list of Failure records.
     """
-    failures_by_col: Dict[str, List[Dict]] = {}
-
-    checks = [
-        ("customer_id",    validate_customer_id(df["customer_id"], df)),
-        ("first_name",     validate_name(df["first_name"],  "first_name")),
-        ("last_name",      validate_name(df["last_name"],   "last_name")),
-        ("email",          validate_email(df["email"])),
-        ("phone",          validate_phone(df["phone"])),
-        ("date_of_birth",  validate_date_column(df["date_of_birth"],  "date_of_birth")),
-        ("created_date",   validate_date_column(df["created_date"],   "created_date")),
-        ("address",        validate_address(df["address"])),
-        ("income",         validate_income(df["income"])),
-        ("account_status", validate_account_status(df["account_status"])),
+    failures_by_col: Dict[str, List[Failure]] = {}
+
+    # (column, validator, extra keyword arguments)
+    tasks = [
+        ("customer_id",    validate_customer_id,    {"df": df}),
+        ("first_name",     validate_name,           {"col_name": "first_name"}),
+        ("last_name",      validate_name,           {"col_name": "last_name"}),
+        ("email",          validate_email,          {}),
+        ("phone",          validate_phone,          {}),
+        ("date_of_birth",  validate_date_column,    {"col_name": "date_of_birth"}),
+        ("created_date",   validate_date_column,    {"col_name": "created_date"}),
+        ("address",        validate_address,        {}),
+        ("income",         validate_income,         {}),
+        ("account_status", validate_account_status, {}),
     ]
 
-    for col_name, col_failures in checks:
+    def run(col_name: str, validator, kwargs: Dict) -> List[Failure]:
+        # Each column is normalised once, then shared by its validator
+        series = df[col_name]
+        stripped = normalize_text(series)
+        if col_name in ROW_LOCAL_COLUMNS:
+            failures = _validate_uniform(series, stripped, validator, kwargs)
+            if failures is not None:
+                return failures
+        return validator(series, stripped=stripped, **kwargs)
+
+    if parallel is None:
+        parallel = len(df) > PARALLEL_MIN_ROWS
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = [pool.submit(run, *task) for task in tasks]
+            results = [f.result() for f in futures]
+    else:
+        results = [run(*task) for task in tasks]
+
+    for (col_name, _, _), col_failures in zip(tasks, results):
         if col_failures:
             failures_by_col[col_name] = col_failures
 
     return failures_by_col
 
 
-def build_report(
+def _report_lines(
     df: pd.DataFrame,
-    failures_by_col: Dict[str, List[Dict]]
-) -> str:
+    failures_by_col: Dict[str, List[Failure]]
+) -> Iterator[str]:
     """
-    Assemble validation results into a formatted report string.
+    Yield the validation report line by line.
 
     Parameters
     ----------
     df : pd.DataFrame
     failures_by_col : dict
 
-    Returns
-    -------
-    str
+    Yields
+    ------
+    str, one report line.
     """
     total_rows = len(df)
     # Rows that failed (1-based row numbers)
     failed_rows: set = set()
     for col_failures in failures_by_col.values():
         for f in col_failures:
-            failed_rows.add(f["row"])
+            failed_rows.add(f.row)
 
     passed_rows = total_rows - len(failed_rows)
     total_failures = sum(len(v) for v in failures_by_col.values())
 
-    lines: List[str] = []
-    lines.append("VALIDATION RESULTS")
-    lines.append("")
-    lines.append(f"PASS: {passed_rows} rows passed all checks")
-    lines.append(f"FAIL: {len(failed_rows)} rows failed at least one check")
-    lines.append("")
+    yield "VALIDATION RESULTS"
+    yield ""
+    yield f"PASS: {passed_rows} rows passed all checks"
+    yield f"FAIL: {len(failed_rows)} rows failed at least one check"
+    yield ""
 
     if failures_by_col:
-        lines.append("FAILURES BY COLUMN:")
-        lines.append("-" * 50)
-        for col in [
-            "customer_id", "first_name", "last_name", "email", "phone",
-            "date_of_birth", "created_date", "address", "income", "account_status"
-        ]:
+        yield "FAILURES BY COLUMN:"
+        yield "-" * 50
+        for col in COLUMN_ORDER:
             if col not in failures_by_col:
                 continue
-            lines.append(f"\n{col}:")
+            yield f"\n{col}:"
             for f in failures_by_col[col]:
-                val_display = repr(str(f["value"])) if not pd.isna(f["value"]) else "NULL/NaN"
-                lines.append(f"  - Row {f['row']}: {val_display} ({f['rule']})")
+                val_display = repr(str(f.value)) if not pd.isna(f.value) else "NULL/NaN"
+                yield f"  - Row {f.row}: {val_display} ({f.rule})"
     else:
-        lines.append("No failures found across all columns.")
+        yield "No failures found across all columns."
 
-    lines.append("")
+    yield ""
     
     
 
     # SUMMARY TABLE 
-    col_order = [
-        "customer_id", "first_name", "last_name", "email", "phone",
-        "date_of_birth", "created_date", "address", "income", "account_status"
-    ]
-    lines.append("SUMMARY TABLE:")
+    yield "SUMMARY TABLE:"
     header = f"  {'Column':<20} {'Rules Checked':<20} {'Pass':>5} {'Fail':>5}"
-    lines.append(header)
-    lines.append("  " + "-" * (len(header) - 2))
-
-    rules_map = {
-        "customer_id":    "Positive int, unique",
-        "first_name":     "Non-empty, 2-50 chars, letters only",
-        "last_name":      "Non-empty, 2-50 chars, letters only",
-        "email":          "Valid email format",
-        "phone":          "10-15 digits when stripped",
-        "date_of_birth":  "Valid date, age 0-150 years",
-        "created_date":   "Valid date, not in future",
-        "address":        "Non-empty string",
-        "income":         "Non-negative, <= $10M",
-        "account_status": "active|inactive|suspended",
-    }
-
-    for col in col_order:
+    yield header
+    yield "  " + "-" * (len(header) - 2)
+
+    for col in COLUMN_ORDER:
         col_failures = failures_by_col.get(col, [])
         fail_count = len(col_failures)
         pass_count = total_rows - fail_count
-        rule_desc = rules_map.get(col, "—")
-        lines.append(
+        rule_desc = RULE_DESCRIPTIONS.get(col, "—")
+        yield (
             f"  {col:<20} {rule_desc:<20} {pass_count:>5} {fail_count:>5}"
         )
 
-    lines.append("")
-    lines.append(
+    yield ""
+    yield (
         f"OVERALL: {total_failures} total validation failure(s) "
         f"across {len(failed_rows)} row(s)"
     )
 
-    return "\n".join(lines)
+
+def build_report(
+    df: pd.DataFrame,
+    failures_by_col: Dict[str, List[Failure]]
+) -> str:
+    """
+    Assemble validation results into a formatted report string.
+
+    run_validation streams the same lines straight to its report file;
+    this joins them for callers that want the text.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    failures_by_col : dict
+
+    Returns
+    -------
+    str
+    """
+    return "\n".join(_report_lines(df, failures_by_col))
 
 
 def run_validation(
-    df: pd.DataFrame, output_dir: str = "."
-) -> Tuple[str, Dict]:
+    df: pd.DataFrame, output_dir: str = ".", keep_text: bool = True
+) -> Tuple[Optional[str], Dict]:
     """
     Run full validation and write validation_results.txt.
 
@@ -519,17 +594,26 @@ def run_validation(
     df : pd.DataFrame
         Raw or cleaned data (dtype=object).
     output_dir : str
+    keep_text : bool
+        Also return the report text. When False the report is streamed to
+        the file line by line and never held in memory as a whole.
 
     Returns
     -------
     (report_text, failures_by_col)
+        report_text is None when keep_text is False.
     """
     failures_by_col = run_all_validators(df)
-    report = build_report(df, failures_by_col)
+    lines = _report_lines(df, failures_by_col)
 
     out_path = os.path.join(output_dir, "validation_results.txt")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(report)
+    with open(out_path, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        if keep_text:
+            report = "\n".join(lines)
+            f.write(report)
+        else:
+            report = None
+            write_lines(lines, f)
 
     return report, failures_by_col
 
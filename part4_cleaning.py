@@ -16,12 +16,29 @@ Exposes run_cleaning(df) for import by the pipeline orchestrator,
 and can also be executed standalone via __main__.
 """
 
-import re
 import os
+import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from typing import Dict, List, Tuple, Any, Optional
 
+from common import (
+    NON_DIGIT_RE, REPORT_BUFFER_SIZE, STRING_DTYPE, LineWriter, parse_dates,
+    parse_floats, regex_text,
+)
+
+try:  # optional: Arrow-backed strings and the Arrow CSV writer
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# account_status values that are not flagged for review (compared lowercased)
+VALID_STATUSES = ["active", "inactive", "suspended"]
 
 
 
@@ -30,7 +47,7 @@ from typing import Dict, List, Tuple, Any, Optional
 
 def _strip_phone(val: Any) -> str:
     """Strip a phone value to digits only."""
-    return re.sub(r"\D", "", str(val))
+    return NON_DIGIT_RE.sub("", str(val))
 
 
 def normalise_phone(val: Any) -> Tuple[str, Optional[str]]:
@@ -74,6 +91,9 @@ def normalise_phone(val: Any) -> Tuple[str, Optional[str]]:
 
 DATE_PARSE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]
 
+# Formats recognised by the future-date and age > 150 checks
+FLAG_DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y"]
+
 
 def normalise_date(val: Any) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -108,6 +128,19 @@ def normalise_date(val: Any) -> Tuple[Optional[str], Optional[str]]:
     return None, f"Unparseable date string '{v}' — set to NaN"
 
 
+def _format_dates(days: np.ndarray) -> np.ndarray:
+    """
+    Render datetime64[D] values as YYYY-MM-DD strings (object array).
+
+    Years before 1000 go through date.strftime so they print exactly as
+    normalise_date would print them.
+    """
+    formatted = np.datetime_as_string(days, unit="D").astype(object)
+    for i in np.flatnonzero(days < np.datetime64("1000-01-01")):
+        formatted[i] = days[i].astype(object).strftime("%Y-%m-%d")
+    return formatted
+
+
 
 
 # Name title-casing
@@ -138,8 +171,8 @@ def normalise_name(val: Any) -> Tuple[str, Optional[str]]:
 # Main cleaning pipeline
 
 def run_cleaning(
-    df: pd.DataFrame, output_dir: str = "."
-) -> Tuple[pd.DataFrame, str]:
+    df: pd.DataFrame, output_dir: str = ".", keep_text: bool = True
+) -> Tuple[pd.DataFrame, Optional[str]]:
     """
     Apply all cleaning steps to the raw DataFrame, write outputs, and return
     the cleaned DataFrame plus a text cleaning log.
@@ -159,17 +192,40 @@ def run_cleaning(
         Raw data loaded as strings.
     output_dir : str
         Directory for output files.
+    keep_text : bool
+        Also return the log text. When False the log is streamed to
+        cleaning_log.txt as it is produced and never held in memory.
 
     Returns
     -------
     (cleaned_df, log_text)
+        log_text is None when keep_text is False.
+    """
+    out_log = os.path.join(output_dir, "cleaning_log.txt")
+    if keep_text:
+        log_lines: List[str] = []
+        cleaned = _clean(df, output_dir, log_lines)
+        log_text = "\n".join(log_lines)
+        with open(out_log, "w", encoding="utf-8") as f:
+            f.write(log_text)
+        return cleaned, log_text
+
+    with open(out_log, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        cleaned = _clean(df, output_dir, LineWriter(f))
+    return cleaned, None
+
+
+def _clean(df: pd.DataFrame, output_dir: str, log_lines: Any) -> pd.DataFrame:
+    """
+    The cleaning steps behind run_cleaning. Log lines go to log_lines via
+    append/extend (a list, or a LineWriter when streaming).
     """
     from part3_validator import run_all_validators  # local import to avoid circularity
 
-    # Work on a copy so the caller's DataFrame is unchanged
-    cleaned = df.copy()
+    # Shallow copy: every step below replaces whole columns, so the caller's
+    # DataFrame is never written to and untouched columns are not copied
+    cleaned = df.copy(deep=False)
 
-    log_lines: List[str] = []
     log_lines.append("DATA CLEANING LOG")
     log_lines.append("")
     log_lines.append("ACTIONS TAKEN:")
@@ -177,82 +233,122 @@ def run_cleaning(
 
 
 
-    # 1. Phone normalisation
-    phone_changes: List[str] = []
-    phone_flags:   List[str] = []
-    for idx, val in cleaned["phone"].items():
-        norm, note = normalise_phone(val)
-        if note:
-            phone_flags.append(f"    Row {idx+2}: '{val}' -> flagged: {note}")
-        elif str(norm) != str(val):
-            phone_changes.append(
-                f"    Row {idx+2}: '{val}' -> '{norm}'"
-            )
-            cleaned.at[idx, "phone"] = norm
+    # 1. Phone normalisation (vectorised form of normalise_phone)
+    phone = cleaned["phone"]
+    phone_str = phone.astype(STRING_DTYPE)
+    phone_stripped = phone_str.str.strip()
+    phone_present = phone_stripped.ne("").to_numpy(dtype=bool, na_value=False)
+
+    digits = (
+        regex_text(phone_stripped).str.replace(NON_DIGIT_RE, "", regex=True)
+        .astype(STRING_DTYPE)
+    )
+    has_country_code = digits.str.len().eq(11) & digits.str.startswith("1")
+    digits = digits.mask(has_country_code, digits.str.slice(1))
+    n_digits = digits.str.len().to_numpy(dtype=np.int64, na_value=0)
+    phone_ok = phone_present & (n_digits == 10)
+    formatted = (
+        digits.str.slice(0, 3) + "-" + digits.str.slice(3, 6) + "-" + digits.str.slice(6, 10)
+    )
+    phone_changed = phone_ok & formatted.ne(phone_str).to_numpy(dtype=bool, na_value=False)
+
+    labels = phone.index.to_numpy()
+    phone_values = phone.to_numpy(dtype=object)
+    formatted_values = formatted.to_numpy(dtype=object)
+    phone_changes: List[str] = [
+        f"    Row {labels[i]+2}: '{phone_values[i]}' -> '{formatted_values[i]}'"
+        for i in np.flatnonzero(phone_changed)
+    ]
+    phone_flags: List[str] = [
+        f"    Row {labels[i]+2}: '{phone_values[i]}' -> flagged: "
+        f"Could not normalise: {n_digits[i]} digits after stripping"
+        for i in np.flatnonzero(phone_present & ~phone_ok)
+    ]
+    if phone_changed.any():
+        cleaned["phone"] = phone.mask(phone_changed, formatted_values)
 
     log_lines.append("\nNormalisation:")
     log_lines.append(
         f"  Phone format: Converted to XXX-XXX-XXXX "
         f"({len(phone_changes)} row(s) affected)"
     )
-    for c in phone_changes:
-        log_lines.append(c)
+    log_lines.extend(phone_changes)
     if phone_flags:
         log_lines.append(f"  Phone flags ({len(phone_flags)} rows could not be normalised):")
-        for f in phone_flags:
-            log_lines.append(f)
+        log_lines.extend(phone_flags)
             
 
 
-    # 2. Date normalisation
+    # 2. Date normalisation (vectorised form of normalise_date)
     date_changes: List[str] = []
     date_nulled:  List[str] = []
 
     for col in ["date_of_birth", "created_date"]:
-        for idx, val in cleaned[col].items():
-            if pd.isna(val) or str(val).strip() == "":
-                continue
-            norm, note = normalise_date(val)
-            if note:
-                # Unparseable — set to NaN
-                date_nulled.append(f"    Row {idx+2} [{col}]: '{val}' — {note}")
-                cleaned.at[idx, col] = pd.NA
-            elif norm and norm != str(val).strip():
-                date_changes.append(
-                    f"    Row {idx+2} [{col}]: '{val}' -> '{norm}'"
-                )
-                cleaned.at[idx, col] = norm
+        stripped = cleaned[col].astype(STRING_DTYPE).str.strip()
+        present = stripped.ne("").to_numpy(dtype=bool, na_value=False)
+        literal = stripped.str.lower().eq("invalid_date").to_numpy(dtype=bool, na_value=False)
+        days = parse_dates(stripped, DATE_PARSE_FORMATS)
+        parsed = present & ~literal & ~np.isnat(days)
+        nulled = present & ~parsed
+        normalised = _format_dates(days)
+        changed = parsed & (normalised != stripped.to_numpy(dtype=object, na_value=""))
+
+        labels = cleaned.index.to_numpy()
+        values = cleaned[col].to_numpy(dtype=object)
+        date_nulled.extend(
+            f"    Row {labels[i]+2} [{col}]: '{values[i]}' — "
+            + (
+                "Literal 'invalid_date' — set to NaN"
+                if literal[i]
+                else f"Unparseable date string '{stripped.iat[i]}' — set to NaN"
+            )
+            for i in np.flatnonzero(nulled)
+        )
+        date_changes.extend(
+            f"    Row {labels[i]+2} [{col}]: '{values[i]}' -> '{normalised[i]}'"
+            for i in np.flatnonzero(changed)
+        )
+        if nulled.any() or changed.any():
+            cleaned[col] = cleaned[col].mask(nulled, pd.NA).mask(changed, normalised)
 
     log_lines.append(
         f"\n  Date format: Converted to YYYY-MM-DD "
         f"({len(date_changes)} row(s) reformatted)"
     )
-    for c in date_changes:
-        log_lines.append(c)
+    log_lines.extend(date_changes)
     if date_nulled:
         log_lines.append(
             f"  Invalid/unparseable dates set to NaN ({len(date_nulled)} occurrence(s)):"
         )
-        for n in date_nulled:
-            log_lines.append(n)
+        log_lines.extend(date_nulled)
 
 
 
-    # 3. Name title-casing
+    # 3. Name title-casing (vectorised form of normalise_name). Arrow's
+    # title-case kernel disagrees with str.title on some non-ASCII letters
+    # (e.g. "ß"), so this column uses the Python-backed string dtype.
     name_changes: List[str] = []
     for col in ["first_name", "last_name"]:
-        for idx, val in cleaned[col].items():
-            norm, note = normalise_name(val)
-            if note:
-                name_changes.append(f"    Row {idx+2} [{col}]: {note}")
-                cleaned.at[idx, col] = norm
+        orig = cleaned[col].astype(pd.StringDtype("python")).str.strip()
+        titled = orig.str.title()
+        changed = titled.ne(orig).to_numpy(dtype=bool, na_value=False)
+        if changed.any():
+            titled_vals = titled.to_numpy(dtype=object)
+            name_changes.extend(
+                f"    Row {i+2} [{col}]: '{o}' -> '{t}'"
+                for i, o, t in zip(
+                    cleaned.index.to_numpy()[changed],
+                    orig.to_numpy(dtype=object)[changed],
+                    titled_vals[changed],
+                )
+            )
+            cleaned[col] = cleaned[col].mask(changed, titled_vals)
 
     log_lines.append(
         f"\n  Name casing: Applied title case "
         f"({len(name_changes)} row(s) affected)"
     )
-    for c in name_changes:
-        log_lines.append(c)
+    log_lines.extend(name_changes)
 
 
     
@@ -269,22 +365,22 @@ def run_cleaning(
     }
 
     for col, fill_val in fill_strategy.items():
-        missing_mask = cleaned[col].apply(
-            lambda v: pd.isna(v) or str(v).strip() == ""
-        )
+        missing_mask = _missing_mask(cleaned[col])
         count = int(missing_mask.sum())
         if count > 0:
-            cleaned.loc[missing_mask, col] = fill_val
+            cleaned[col] = cleaned[col].mask(missing_mask, fill_val)
             log_lines.append(
                 f"  {col}: {count} row(s) missing -> filled with '{fill_val}'"
             )
         else:
             log_lines.append(f"  {col}: 0 rows missing — no action needed")
 
+    # account_status has a handful of distinct values once filled; store it
+    # as a categorical so later checks work on the categories, not every row
+    cleaned["account_status"] = cleaned["account_status"].astype("category")
+
     # date_of_birth: leave NaN as-is
-    dob_missing = cleaned["date_of_birth"].apply(
-        lambda v: pd.isna(v) or str(v).strip() == ""
-    ).sum()
+    dob_missing = _missing_mask(cleaned["date_of_birth"]).sum()
     log_lines.append(
         f"  date_of_birth: {int(dob_missing)} row(s) missing -> left as NaN "
         f"(cannot be inferred)"
@@ -297,12 +393,12 @@ def run_cleaning(
 
     # 5a. Duplicate customer_id — keep first, drop rest
     before_len = len(cleaned)
-    dupe_mask = cleaned["customer_id"].astype(str).duplicated(keep="first")
-    duped_rows = cleaned[dupe_mask]
-    if not duped_rows.empty:
+    dupe_mask = cleaned["customer_id"].astype(str).duplicated(keep="first").to_numpy()
+    if dupe_mask.any():
+        dupe_labels = cleaned.index.to_numpy()[dupe_mask]
+        dupe_ids = cleaned["customer_id"].to_numpy(dtype=object)[dupe_mask]
         dupe_info = [
-            f"Row {idx+2} (ID={row['customer_id']})"
-            for idx, row in duped_rows.iterrows()
+            f"Row {idx+2} (ID={cid})" for idx, cid in zip(dupe_labels, dupe_ids)
         ]
         cleaned = cleaned[~dupe_mask].reset_index(drop=True)
         log_lines.append(
@@ -313,17 +409,17 @@ def run_cleaning(
         log_lines.append("  Duplicate customer_id: none found")
 
     # 5b. Negative income — set to 0
-    neg_income_mask = cleaned["income"].apply(
-        lambda v: False if (pd.isna(v) or str(v).strip() == "")
-        else _safe_float(str(v).strip(), default=0) < 0
-    )
+    income_num = _parse_income(cleaned["income"])
+    income_vals = cleaned["income"].to_numpy(dtype=object)
+    labels = cleaned.index.to_numpy()
+    neg_income_mask = income_num < 0
     neg_count = int(neg_income_mask.sum())
     if neg_count > 0:
         neg_rows = [
-            f"Row {idx+2}: original income = {cleaned.at[idx, 'income']}"
-            for idx in cleaned.index[neg_income_mask]
+            f"Row {labels[i]+2}: original income = {income_vals[i]}"
+            for i in np.flatnonzero(neg_income_mask)
         ]
-        cleaned.loc[neg_income_mask, "income"] = "0"
+        cleaned["income"] = cleaned["income"].mask(neg_income_mask, "0")
         log_lines.append(
             f"  Negative income: {neg_count} row(s) set to 0 — "
             + ", ".join(neg_rows)
@@ -332,15 +428,12 @@ def run_cleaning(
         log_lines.append("  Negative income: none found")
 
     # 5c. Income > $10M — flag but do NOT modify
-    high_income_mask = cleaned["income"].apply(
-        lambda v: False if (pd.isna(v) or str(v).strip() == "")
-        else _safe_float(str(v).strip(), default=0) > 10_000_000
-    )
+    high_income_mask = income_num > 10_000_000
     hi_count = int(high_income_mask.sum())
     if hi_count > 0:
         hi_rows = [
-            f"Row {idx+2}: income = {cleaned.at[idx, 'income']}"
-            for idx in cleaned.index[high_income_mask]
+            f"Row {labels[i]+2}: income = {income_vals[i]}"
+            for i in np.flatnonzero(high_income_mask)
         ]
         log_lines.append(
             f"  Income > $10M: {hi_count} row(s) flagged for review (NOT modified) — "
@@ -350,16 +443,20 @@ def run_cleaning(
         log_lines.append("  Income > $10M: none found")
 
     # 5d. Invalid account_status — flag but do NOT modify
-    valid_statuses = {"active", "inactive", "suspended", "unknown", "[unknown]"}
-    bad_status_mask = cleaned["account_status"].apply(
-        lambda v: False if (pd.isna(v) or str(v).strip() == "")
-        else str(v).strip().lower() not in {"active", "inactive", "suspended"}
+    status = cleaned["account_status"].cat
+    categories = pd.Series(status.categories).astype(STRING_DTYPE).str.strip().str.lower()
+    bad_category = (
+        categories.ne("").to_numpy(dtype=bool, na_value=False)
+        & ~categories.isin(VALID_STATUSES).to_numpy(dtype=bool, na_value=False)
     )
+    codes = status.codes.to_numpy()
+    bad_status_mask = (codes >= 0) & bad_category[codes]
     bad_count = int(bad_status_mask.sum())
     if bad_count > 0:
+        status_vals = cleaned["account_status"].to_numpy(dtype=object)
         bad_rows = [
-            f"Row {idx+2}: '{cleaned.at[idx, 'account_status']}'"
-            for idx in cleaned.index[bad_status_mask]
+            f"Row {labels[i]+2}: '{status_vals[i]}'"
+            for i in np.flatnonzero(bad_status_mask)
         ]
         log_lines.append(
             f"  Invalid account_status: {bad_count} row(s) flagged for review — "
@@ -370,14 +467,15 @@ def run_cleaning(
 
     # 5e. Future created_date — flag but do NOT modify
     today = date.today()
-    future_date_mask = cleaned["created_date"].apply(
-        lambda v: _is_future_date(v, today)
-    )
+    today_day = np.datetime64(today, "D")
+    created = cleaned["created_date"].astype(STRING_DTYPE).str.strip()
+    future_date_mask = parse_dates(created, FLAG_DATE_FORMATS) > today_day
     fut_count = int(future_date_mask.sum())
     if fut_count > 0:
+        created_vals = cleaned["created_date"].to_numpy(dtype=object)
         fut_rows = [
-            f"Row {idx+2}: '{cleaned.at[idx, 'created_date']}'"
-            for idx in cleaned.index[future_date_mask]
+            f"Row {labels[i]+2}: '{created_vals[i]}'"
+            for i in np.flatnonzero(future_date_mask)
         ]
         log_lines.append(
             f"  Future created_date: {fut_count} row(s) flagged for review (NOT modified) — "
@@ -387,23 +485,21 @@ def run_cleaning(
         log_lines.append("  Future created_date: none found")
 
     # 5f. Age > 150 — set date_of_birth to NaN
-    age_flag_rows: List[str] = []
-    for idx, val in cleaned["date_of_birth"].items():
-        if pd.isna(val) or str(val).strip() == "":
-            continue
-        v = str(val).strip()
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y"]:
-            try:
-                dob = datetime.strptime(v, fmt).date()
-                age = (today - dob).days / 365.25
-                if age > 150:
-                    age_flag_rows.append(
-                        f"Row {idx+2}: DOB '{val}' (~{age:.1f} years old)"
-                    )
-                    cleaned.at[idx, "date_of_birth"] = pd.NA
-                break
-            except ValueError:
-                pass
+    dob = cleaned["date_of_birth"].astype(STRING_DTYPE).str.strip()
+    dob_days = parse_dates(dob, FLAG_DATE_FORMATS)
+    # age > 150 years (days / 365.25) is the same as born on or before the
+    # cutoff day below, so the mask is one datetime64 comparison (NaT is
+    # never <=) and ages are only computed for the flagged rows
+    cutoff_day = today_day - np.timedelta64(math.floor(150 * 365.25) + 1, "D")
+    age_mask = dob_days <= cutoff_day
+    dob_vals = cleaned["date_of_birth"].to_numpy(dtype=object)
+    age_flag_rows: List[str] = [
+        f"Row {labels[i]+2}: DOB '{dob_vals[i]}' "
+        f"(~{int((today_day - dob_days[i]).astype(np.int64)) / 365.25:.1f} years old)"
+        for i in np.flatnonzero(age_mask)
+    ]
+    if age_mask.any():
+        cleaned["date_of_birth"] = cleaned["date_of_birth"].mask(age_mask, pd.NA)
 
     if age_flag_rows:
         log_lines.append(
@@ -412,16 +508,18 @@ def run_cleaning(
         )
     else:
         log_lines.append("  Age > 150: none found")
-        
-        
+
 
 
     # 6. Re-validate
     # Count failures on raw vs cleaned
-    raw_failures_by_col = run_all_validators(df)
+    # The two runs are independent reads, so they overlap on two threads
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        raw_future = pool.submit(run_all_validators, df)
+        clean_future = pool.submit(run_all_validators, cleaned)
+        raw_failures_by_col = raw_future.result()
+        clean_failures_by_col = clean_future.result()
     raw_total = sum(len(v) for v in raw_failures_by_col.values())
-
-    clean_failures_by_col = run_all_validators(cleaned)
     clean_total = sum(len(v) for v in clean_failures_by_col.values())
 
     improvement = raw_total - clean_total
@@ -443,25 +541,98 @@ def run_cleaning(
     
     # 7. Save cleaned CSV
     out_csv = os.path.join(output_dir, "customers_cleaned.csv")
-    cleaned.to_csv(out_csv, index=False)
+    write_csv(cleaned, out_csv)
     log_lines.append(
         f"\nOutput: customers_cleaned.csv "
         f"({len(cleaned)} rows, {len(cleaned.columns)} columns)"
     )
 
-    log_text = "\n".join(log_lines)
+    return cleaned
 
-    # Write cleaning log
-    out_log = os.path.join(output_dir, "cleaning_log.txt")
-    with open(out_log, "w", encoding="utf-8") as f:
-        f.write(log_text)
 
-    return cleaned, log_text
+
+# CSV output
+
+def _arrow_csv_safe(df: pd.DataFrame) -> bool:
+    """
+    True when the Arrow writer can reproduce write_csv's pandas path byte
+    for byte: string columns only, header names that need no quoting, and
+    more than one column (pandas quotes an empty value in a one-column file).
+    """
+    if len(df.columns) < 2:
+        return False
+    for col in df.columns:
+        if not isinstance(col, str) or any(ch in col for ch in ',"\r\n'):
+            return False
+    return all(
+        pd.api.types.is_object_dtype(dt)
+        or isinstance(dt, pd.StringDtype)
+        or isinstance(dt, pd.CategoricalDtype)
+        for dt in df.dtypes
+    )
+
+
+def _is_arrow_text(arrow_type: Any) -> bool:
+    """True for Arrow string columns (and all-null ones, which write as empty)."""
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Write df to path as CSV without the index.
+
+    Uses pyarrow's multi-threaded CSV writer when it is installed and the
+    output would be identical to the pandas path; any value that needs
+    quoting (comma, quote, line break) or is not a string sends the whole
+    frame back to pandas. Both paths end lines with "\\n".
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    path : str
+    """
+    if HAS_PYARROW and _arrow_csv_safe(df):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            text_only = all(
+                _is_arrow_text(t.value_type if pa.types.is_dictionary(t) else t)
+                for t in table.schema.types
+            )
+            if text_only:
+                options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+                with open(path, "wb") as f:
+                    f.write((",".join(df.columns) + "\n").encode("utf-8"))
+                    pa_csv.write_csv(table, f, write_options=options)
+                return
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    df.to_csv(path, index=False, lineterminator="\n")
+
 
 
 
 # Utility helpers
 
+def _missing_mask(series: pd.Series) -> np.ndarray:
+    """Boolean array: True where the value is NA or blank after stripping."""
+    stripped = series.astype(STRING_DTYPE).str.strip()
+    return stripped.eq("").to_numpy(dtype=bool, na_value=True)
+
+
+def _parse_income(series: pd.Series) -> np.ndarray:
+    """
+    Parse an income column to float64, 0 where the value is missing or not
+    numeric (the vectorised form of _safe_float with default=0).
+    """
+    nums, _ = parse_floats(series.astype(STRING_DTYPE).str.strip())
+    nums[np.isnan(nums)] = 0
+    return nums
+
+
 def _safe_float(val: str, default: float = 0.0) -> float:
     """Parse a string to float, returning default on failure."""
     try:
@@ -470,20 +641,6 @@ def _safe_float(val: str, default: float = 0.0) -> float:
         return default
 
 
-def _is_future_date(val: Any, today: date) -> bool:
-    """Return True if val is a valid date string in the future."""
-    if pd.isna(val) or str(val).strip() == "":
-        return False
-    v = str(val).strip()
-    for fmt in ["%Y-%m-%d", "%m/%d/%Y"]:
-        try:
-            d = datetime.strptime(v, fmt).date()
-            return d > today
-        except ValueError:
-            pass
-    return False
-
-
 
 
 # Standalone entry point
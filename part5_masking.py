@@ -23,10 +23,17 @@ and can also be executed standalone via __main__.
 """
 
 import os
-import re
+import numpy as np
 import pandas as pd
 from typing import Any, Tuple
 
+from common import NON_DIGIT_RE, STRING_DTYPE, regex_text
+
+
+# Shapes Part 4 writes phones and dates in; a column made up only of these
+# (and blanks) is masked by slicing, skipping the general rules
+_CLEAN_PHONE_PATTERN = r"[0-9]{3}-[0-9]{3}-[0-9]{4}"
+_CLEAN_DATE_PATTERN = r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
 
 
 # Masking functions
@@ -108,7 +115,7 @@ def mask_phone(val: Any) -> str:
         return ""
     v = str(val).strip()
     # Strip to digits
-    digits = re.sub(r"\D", "", v)
+    digits = NON_DIGIT_RE.sub("", v)
     if len(digits) == 11 and digits.startswith("1"):
         digits = digits[1:]
     if len(digits) == 10:
@@ -167,6 +174,84 @@ def mask_dob(val: Any) -> str:
 
 
 
+# Column-wise masking (vectorised equivalents of the functions above)
+
+def _strip(series: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """Return the column as stripped STRING_DTYPE and its NA-or-blank mask."""
+    stripped = series.astype(STRING_DTYPE).str.strip()
+    return stripped, stripped.eq("").to_numpy(dtype=bool, na_value=True)
+
+
+def _values(series: pd.Series) -> np.ndarray:
+    """Object array of a string column (NA cells become "")."""
+    return series.to_numpy(dtype=object, na_value="")
+
+
+def _all_shaped(s: pd.Series, missing: np.ndarray, pattern: str) -> bool:
+    """True when every non-blank value of s fully matches pattern."""
+    shaped = s.str.fullmatch(pattern).to_numpy(dtype=bool, na_value=False)
+    return bool((shaped | missing).all())
+
+
+def _mask_names(series: pd.Series) -> np.ndarray:
+    """mask_name applied to every value of a column."""
+    s, missing = _strip(series)
+    masked = np.where(s.eq("[UNKNOWN]").to_numpy(dtype=bool, na_value=False),
+                      _values(s), _values(s.str.slice(0, 1) + "***"))
+    return np.where(missing, "", masked)
+
+
+def _mask_emails(series: pd.Series) -> np.ndarray:
+    """mask_email applied to every value of a column."""
+    s, missing = _strip(series)
+    # Keep the first character of the local part (if any) and the domain
+    # after the first '@'; values without '@' do not match and pass through.
+    masked = s.str.replace(r"^([^@]?)[^@]*@", r"\1***@", n=1, regex=True)
+    return np.where(missing, "", _values(masked))
+
+
+def _mask_phones(series: pd.Series) -> np.ndarray:
+    """mask_phone applied to every value of a column."""
+    s, missing = _strip(series)
+    if _all_shaped(s, missing, _CLEAN_PHONE_PATTERN):
+        return np.where(missing, "", _values("***-***-" + s.str.slice(8)))
+    digits = regex_text(s).str.replace(NON_DIGIT_RE, "", regex=True).astype(STRING_DTYPE)
+    digits = digits.mask(digits.str.len().eq(11) & digits.str.startswith("1"), digits.str.slice(1))
+    ten = digits.str.len().eq(10).to_numpy(dtype=bool, na_value=False)
+    long_enough = s.str.len().ge(4).to_numpy(dtype=bool, na_value=False)
+    masked = np.select(
+        [ten, long_enough],
+        [_values("***-***-" + digits.str.slice(6)), _values("***" + s.str.slice(-4))],
+        "****",
+    )
+    return np.where(missing, "", masked)
+
+
+def _mask_addresses(series: pd.Series) -> np.ndarray:
+    """mask_address applied to every value of a column."""
+    s, missing = _strip(series)
+    placeholder = s.eq("[UNKNOWN]").to_numpy(dtype=bool, na_value=False)
+    return np.where(missing | placeholder, _values(s), "[MASKED ADDRESS]")
+
+
+def _mask_dobs(series: pd.Series) -> np.ndarray:
+    """mask_dob applied to every value of a column."""
+    s, missing = _strip(series)
+    if _all_shaped(s, missing, _CLEAN_DATE_PATTERN):
+        return np.where(missing, "", _values(s.str.slice(0, 4) + "-**-**"))
+    # The year is the text before the first '-', kept when 4 characters long
+    year = s.str.slice(0, 4)
+    four = (
+        year.str.len().eq(4)
+        & ~year.str.contains("-", regex=False)
+        & s.str.slice(4, 5).isin(["", "-"])
+    ).to_numpy(dtype=bool, na_value=False)
+    masked = np.where(four, _values(year + "-**-**"), "****-**-**")
+    return np.where(missing, "", masked)
+
+
+
+
 # Apply masking to DataFrame
 
 def apply_masking(df: pd.DataFrame) -> pd.DataFrame:
@@ -183,14 +268,16 @@ def apply_masking(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         New DataFrame with PII columns masked.
     """
-    masked = df.copy()
+    # Shallow copy: the masked columns are replaced wholesale below and the
+    # intact ones are shared with df rather than copied
+    masked = df.copy(deep=False)
 
-    masked["first_name"]    = masked["first_name"].apply(mask_name)
-    masked["last_name"]     = masked["last_name"].apply(mask_name)
-    masked["email"]         = masked["email"].apply(mask_email)
-    masked["phone"]         = masked["phone"].apply(mask_phone)
-    masked["address"]       = masked["address"].apply(mask_address)
-    masked["date_of_birth"] = masked["date_of_birth"].apply(mask_dob)
+    masked["first_name"]    = _mask_names(masked["first_name"])
+    masked["last_name"]     = _mask_names(masked["last_name"])
+    masked["email"]         = _mask_emails(masked["email"])
+    masked["phone"]         = _mask_phones(masked["phone"])
+    masked["address"]       = pd.Categorical(_mask_addresses(masked["address"]))
+    masked["date_of_birth"] = _mask_dobs(masked["date_of_birth"])
 
     # customer_id, income, account_status, created_date — untouched
 
@@ -220,11 +307,8 @@ def build_sample_report(
     str
     """
     def df_to_lines(df: pd.DataFrame, rows: int) -> list:
-        cols = ",".join(df.columns)
-        result = [cols]
-        for i, row in df.head(rows).iterrows():
-            result.append(",".join(str(v) for v in row))
-        return result
+        # Header plus the first rows, rendered exactly as in the CSV files
+        return df.head(rows).to_csv(index=False).splitlines()
 
     lines = []
     lines.append(f"BEFORE MASKING (first {n} rows):")
@@ -293,8 +377,10 @@ def run_masking(
         f.write(sample_report)
 
     # Write customers_masked.csv
+    from part4_cleaning import write_csv  # Arrow CSV writer with to_csv fallback
+
     masked_csv_path = os.path.join(output_dir, "customers_masked.csv")
-    masked_df.to_csv(masked_csv_path, index=False)
+    write_csv(masked_df, masked_csv_path)
 
     return masked_df, sample_report
 
@@ -4,7 +4,8 @@ part6_pipeline.py
 End-to-end orchestration pipeline for the PII Detection & Data Quality
 Validation project.
 
-Loads raw customer data, then executes all five processing stages in sequence:
+Loads raw customer data, then executes all five processing stages in sequence
+(Stages 2-4 only read the raw data and run concurrently):
   Stage 1  Load
   Stage 2  Data Quality Profiling  
   Stage 3  PII Detection           
@@ -13,29 +14,38 @@ Loads raw customer data, then executes all five processing stages in sequence:
   Stage 6  PII Masking             
   Stage 7  Save pipeline report
 
-Each stage is wrapped in its own try/except block.  A stage failure is logged
-and execution continues where possible; a CSV load failure terminates the run.
+Each stage after loading runs through _run_stage, which catches and logs its
+failure so execution continues where possible; a CSV load failure terminates
+the run.
 
 All output files are written to the same directory as the input CSV (or an
 optional output_dir argument).
 
 Usage
 -----
-    python part6_pipeline.py [input_csv] [output_dir]
+    python part6_pipeline.py [input_csv] [output_dir] [workers]
 
     # defaults:
-    python part6_pipeline.py customers_raw.csv .
+    python part6_pipeline.py customers_raw.csv . 1
+
+workers > 1 also runs the Stage 2 profiling scans on threads.
 """
 
+import functools
+import gc
+import importlib
 import logging
 import os
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from types import ModuleType
+from typing import Any, Callable, Dict, Tuple
 
 import pandas as pd
 
+from common import REPORT_BUFFER_SIZE
+
 
 
 # Logging setup
@@ -46,109 +56,127 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Report label per stage: (number, description, output files); None means
+# the input CSV path, filled in when the report is built
+_STAGE_LABELS = {
+    "load":       ("1", "Data loaded",                 None),
+    "quality":    ("2", "Quality profiling complete",  "data_quality_report.txt"),
+    "pii":        ("3", "PII detection complete",      "pii_detection_report.txt"),
+    "validation": ("4", "Validation complete",         "validation_results.txt"),
+    "cleaning":   ("5", "Data cleaning complete",      "cleaning_log.txt, customers_cleaned.csv"),
+    "masking":    ("6", "PII masking complete",        "masked_sample.txt, customers_masked.csv"),
+}
 
 
 
-# Pipeline orchestrator
 
-def run_pipeline(
-    input_csv_path: str = "customers_raw.csv",
-    output_dir: str = ".",
-) -> None:
+# Stage modules
+
+@functools.lru_cache(maxsize=None)
+def _load_stage(module_name: str) -> ModuleType:
     """
-    Execute the full data quality and PII pipeline from a single entry point.
+    Import a stage module once per process.
+
+    Stages import lazily (inside their own try/except) so a broken module
+    only fails its own stage; the cache makes every later lookup, e.g. on
+    repeated run_pipeline calls, a plain dict hit.
+    """
+    return importlib.import_module(module_name)
+
+
+
+
+# Stage runner
+# Every stage after loading is run through _run_stage, so a failure is
+# logged and recorded the same way everywhere and never stops the pipeline.
+
+def _run_stage(
+    stage: int,
+    action: str,
+    fn: Callable[[], Any],
+    summarize: Callable[[Any], Dict],
+) -> Tuple[Dict, Any]:
+    """
+    Run one stage body and summarise its output for the final report.
 
     Parameters
     ----------
-    input_csv_path : str
-        Path to the raw input CSV file.
-    output_dir : str
-        Directory where all output files will be written.
+    stage : int
+        Stage number, used in log messages.
+    action : str
+        Short description of the stage, e.g. "Profiling".
+    fn : callable
+        Zero-argument stage body; its return value is the stage output.
+    summarize : callable
+        Maps the stage output to its stage_results entry (and logs success).
 
     Returns
     -------
-    None
-        Writes all deliverable files to output_dir as a side-effect.
+    Tuple[Dict, Any]
+        (stage_result, stage_output); on failure the result has status
+        "FAILED" and the output is None.
     """
-    start_time = datetime.now()
-    logger.info("=" * 60)
-    logger.info("PII DETECTION & DATA QUALITY VALIDATION PIPELINE")
-    logger.info("=" * 60)
-    logger.info(f"Input  : {os.path.abspath(input_csv_path)}")
-    logger.info(f"Output : {os.path.abspath(output_dir)}")
-
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Track stage outcomes for the final report
-    stage_results = {}
+    try:
+        out = fn()
+        return summarize(out), out
+    except Exception as exc:
+        logger.exception("[Stage %d] %s failed: %s", stage, action, exc)
+        return {"status": "FAILED", "detail": str(exc)}, None
 
 
 
-    
-    # Stage 1: Load
-    logger.info("[Stage 1] Loading raw data ...")
-    try:
-        raw_df = pd.read_csv(input_csv_path, dtype=str, keep_default_na=False)
-        raw_df.replace("", pd.NA, inplace=True)
-        n_rows, n_cols = raw_df.shape
-        logger.info(f"[Stage 1] Loaded {n_rows} rows × {n_cols} columns.")
-        stage_results["load"] = {
-            "status": "SUCCESS",
-            "detail": f"{n_rows} rows, {n_cols} columns",
-        }
-    except FileNotFoundError:
-        logger.error(f"[Stage 1] File not found: {input_csv_path}")
-        logger.error("Pipeline cannot continue without input data. Exiting.")
-        raise SystemExit(1)
-    except Exception as exc:
-        logger.error(f"[Stage 1] Unexpected error loading CSV: {exc}")
-        raise SystemExit(1)
 
+# Stages 2-4 (independent readers of raw_df, run concurrently)
+# Each returns (stage_key, stage_result, stage_output) and never raises.
 
-    
-    # Stage 2: Data Quality Profiling
-    logger.info("[Stage 2] Running data quality profiling ...")
-    try:
-        from part1_data_quality import run_quality_analysis
-        _, findings = run_quality_analysis(raw_df, output_dir=output_dir)
+def _stage_quality(
+    raw_df: pd.DataFrame, output_dir: str, workers: int = 1
+) -> Tuple[str, Dict, Any]:
+    """Stage 2: data quality profiling -> data_quality_report.txt."""
+    def summarize(findings: Dict) -> Dict:
         total_issues = (
             len(findings.get("invalid_vals", []))
             + len(findings.get("status_issues", []))
             + len(findings.get("name_issues", []))
         )
         logger.info(
-            f"[Stage 2] Profiling complete. "
-            f"Issues detected: {total_issues}. "
-            f"-> data_quality_report.txt"
+            "[Stage 2] Profiling complete. "
+            "Issues detected: %d. "
+            "-> data_quality_report.txt",
+            total_issues,
         )
-        stage_results["quality"] = {
+        return {
             "status": "SUCCESS",
             "detail": f"{total_issues} quality issues found",
             "file": "data_quality_report.txt",
         }
-    except Exception as exc:
-        logger.warning(f"[Stage 2] Profiling failed: {exc}\n{traceback.format_exc()}")
-        stage_results["quality"] = {"status": "FAILED", "detail": str(exc)}
 
+    info, findings = _run_stage(
+        2, "Profiling",
+        lambda: _load_stage("part1_data_quality").run_quality_analysis(
+            raw_df, output_dir=output_dir, parallel=workers > 1
+        )[1],
+        summarize,
+    )
+    return "quality", info, findings
 
 
-    
-    # Stage 3: PII Detection
-    logger.info("[Stage 3] Running PII detection ...")
-    try:
-        from part2_pii_detection import run_pii_detection
-        _, pii_findings = run_pii_detection(raw_df, output_dir=output_dir)
+def _stage_pii(
+    raw_df: pd.DataFrame, output_dir: str, workers: int = 1
+) -> Tuple[str, Dict, Any]:
+    """Stage 3: PII detection -> pii_detection_report.txt."""
+    def summarize(pii_findings: Dict) -> Dict:
         n_email = len(pii_findings.get("email_rows", []))
         n_phone = len(pii_findings.get("phone_rows", []))
         n_addr  = len(pii_findings.get("address_rows", []))
         n_dob   = len(pii_findings.get("dob_rows", []))
         logger.info(
-            f"[Stage 3] PII detection complete. "
-            f"Emails: {n_email}, Phones: {n_phone}, "
-            f"Addresses: {n_addr}, DOBs: {n_dob}. "
-            f"-> pii_detection_report.txt"
+            "[Stage 3] PII detection complete. "
+            "Emails: %d, Phones: %d, Addresses: %d, DOBs: %d. "
+            "-> pii_detection_report.txt",
+            n_email, n_phone, n_addr, n_dob,
         )
-        stage_results["pii"] = {
+        return {
             "status": "SUCCESS",
             "detail": (
                 f"Emails: {n_email}, Phones: {n_phone}, "
@@ -156,84 +184,203 @@ def run_pipeline(
             ),
             "file": "pii_detection_report.txt",
         }
-    except Exception as exc:
-        logger.warning(f"[Stage 3] PII detection failed: {exc}\n{traceback.format_exc()}")
-        stage_results["pii"] = {"status": "FAILED", "detail": str(exc)}
 
+    info, pii_findings = _run_stage(
+        3, "PII detection",
+        lambda: _load_stage("part2_pii_detection").run_pii_detection(
+            raw_df, output_dir=output_dir, keep_text=False
+        )[1],
+        summarize,
+    )
+    return "pii", info, pii_findings
 
 
-    
-    # Stage 4: Validation
-    logger.info("[Stage 4] Running validation ...")
-    try:
-        from part3_validator import run_validation
-        _, failures_by_col = run_validation(raw_df, output_dir=output_dir)
-        total_failures = sum(len(v) for v in failures_by_col.values())
+def _stage_validation(
+    raw_df: pd.DataFrame, output_dir: str, workers: int = 1
+) -> Tuple[str, Dict, Any]:
+    """Stage 4: validation -> validation_results.txt."""
+    def summarize(failures_by_col: Dict) -> Dict:
+        total_failures = 0
         failed_rows = set()
         for col_failures in failures_by_col.values():
-            for f in col_failures:
-                failed_rows.add(f["row"])
+            total_failures += len(col_failures)
+            failed_rows.update(f.row for f in col_failures)
         logger.info(
-            f"[Stage 4] Validation complete. "
-            f"{total_failures} failure(s) across {len(failed_rows)} row(s). "
-            f"-> validation_results.txt"
+            "[Stage 4] Validation complete. "
+            "%d failure(s) across %d row(s). "
+            "-> validation_results.txt",
+            total_failures, len(failed_rows),
         )
-        stage_results["validation"] = {
+        return {
             "status": "SUCCESS" if total_failures == 0 else "WARNINGS",
             "detail": f"{total_failures} failures in {len(failed_rows)} rows",
             "file": "validation_results.txt",
         }
+
+    info, failures_by_col = _run_stage(
+        4, "Validation",
+        lambda: _load_stage("part3_validator").run_validation(
+            raw_df, output_dir=output_dir, keep_text=False
+        )[1],
+        summarize,
+    )
+    return "validation", info, failures_by_col or {}
+
+
+
+
+# Stage 6
+
+def _stage_masking(cleaned_df: pd.DataFrame, output_dir: str) -> Tuple[str, Dict, Any]:
+    """Stage 6: PII masking -> masked_sample.txt, customers_masked.csv."""
+    def summarize(masked_df: pd.DataFrame) -> Dict:
+        logger.info(
+            "[Stage 6] Masking complete. "
+            "-> masked_sample.txt, customers_masked.csv"
+        )
+        return {
+            "status": "SUCCESS",
+            "detail": "All PII columns masked",
+            "files": ["masked_sample.txt", "customers_masked.csv"],
+        }
+
+    info, masked_df = _run_stage(
+        6, "Masking",
+        lambda: _load_stage("part5_masking").run_masking(
+            cleaned_df, output_dir=output_dir
+        )[0],
+        summarize,
+    )
+    return "masking", info, masked_df
+
+
+
+
+# Pipeline orchestrator
+
+def run_pipeline(
+    input_csv_path: str = "customers_raw.csv",
+    output_dir: str = ".",
+    workers: int = 1,
+) -> None:
+    """
+    Execute the full data quality and PII pipeline from a single entry point.
+
+    Parameters
+    ----------
+    input_csv_path : str
+        Path to the raw input CSV file.
+    output_dir : str
+        Directory where all output files will be written.
+    workers : int
+        Above 1, Stage 2 runs its scans on threads. Output is identical; it
+        only pays off on large inputs with spare cores.
+
+    Returns
+    -------
+    None
+        Writes all deliverable files to output_dir as a side-effect.
+    """
+    start_time = datetime.now()
+    logger.info("=" * 60)
+    logger.info("PII DETECTION & DATA QUALITY VALIDATION PIPELINE")
+    logger.info("=" * 60)
+    # Resolve both paths once; the report still shows the input path as given
+    input_abspath = os.path.abspath(input_csv_path)
+    output_dir = os.path.abspath(output_dir)
+    logger.info("Input  : %s", input_abspath)
+    logger.info("Output : %s", output_dir)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Track stage outcomes for the final report
+    stage_results = {}
+
+
+
+    
+    # Stage 1: Load
+    logger.info("[Stage 1] Loading raw data ...")
+    try:
+        load_raw_csv = _load_stage("part1_data_quality").load_raw_csv
+        raw_df = load_raw_csv(input_abspath)
+        n_rows, n_cols = raw_df.shape
+        logger.info("[Stage 1] Loaded %d rows × %d columns.", n_rows, n_cols)
+        stage_results["load"] = {
+            "status": "SUCCESS",
+            "detail": f"{n_rows} rows, {n_cols} columns",
+        }
+    except FileNotFoundError:
+        logger.error("[Stage 1] File not found: %s", input_csv_path)
+        logger.error("Pipeline cannot continue without input data. Exiting.")
+        raise SystemExit(1)
     except Exception as exc:
-        logger.warning(f"[Stage 4] Validation failed: {exc}\n{traceback.format_exc()}")
-        stage_results["validation"] = {"status": "FAILED", "detail": str(exc)}
-        failures_by_col = {}
+        logger.exception("[Stage 1] Unexpected error loading CSV: %s", exc)
+        raise SystemExit(1)
+
+
+    
+    # Stages 2-4 only read raw_df and write their own reports, so they run
+    # concurrently; cleaning waits for all three.
+    logger.info("[Stage 2] Running data quality profiling ...")
+    logger.info("[Stage 3] Running PII detection ...")
+    logger.info("[Stage 4] Running validation ...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(stage, raw_df, output_dir, workers)
+            for stage in (_stage_quality, _stage_pii, _stage_validation)
+        ]
+        # Import the cleaning/masking modules on whichever worker frees up
+        # first; an import error resurfaces inside that stage's own try.
+        for module_name in ("part4_cleaning", "part5_masking"):
+            pool.submit(_load_stage, module_name)
+        for future in futures:
+            key, info, _ = future.result()
+            stage_results[key] = info
+
 
 
     
     # Stage 5: Cleaning
     logger.info("[Stage 5] Running data cleaning ...")
-    cleaned_df: Optional[pd.DataFrame] = None
-    try:
-        from part4_cleaning import run_cleaning
-        cleaned_df, _ = run_cleaning(raw_df, output_dir=output_dir)
+    def summarize_cleaning(cleaned: pd.DataFrame) -> Dict:
         logger.info(
-            f"[Stage 5] Cleaning complete. "
-            f"Output: {len(cleaned_df)} rows × {len(cleaned_df.columns)} columns. "
-            f"-> cleaning_log.txt, customers_cleaned.csv"
+            "[Stage 5] Cleaning complete. "
+            "Output: %d rows × %d columns. "
+            "-> cleaning_log.txt, customers_cleaned.csv",
+            len(cleaned), len(cleaned.columns),
         )
-        stage_results["cleaning"] = {
+        return {
             "status": "SUCCESS",
-            "detail": f"{len(cleaned_df)} rows after cleaning",
+            "detail": f"{len(cleaned)} rows after cleaning",
             "files": ["cleaning_log.txt", "customers_cleaned.csv"],
         }
-    except Exception as exc:
-        logger.warning(f"[Stage 5] Cleaning failed: {exc}\n{traceback.format_exc()}")
-        stage_results["cleaning"] = {"status": "FAILED", "detail": str(exc)}
+
+    stage_results["cleaning"], cleaned_df = _run_stage(
+        5, "Cleaning",
+        lambda: _load_stage("part4_cleaning").run_cleaning(
+            raw_df, output_dir=output_dir, keep_text=False
+        )[0],
+        summarize_cleaning,
+    )
+    if cleaned_df is None:
         cleaned_df = raw_df  # fall back to raw if cleaning failed
-        
-        
+    else:
+        # Nothing reads raw_df after cleaning; release it before masking
+        # allocates its copy rather than holding it to the end
+        del raw_df
+        gc.collect()
+
+
 
     
     # Stage 6: PII Masking
     logger.info("[Stage 6] Running PII masking ...")
-    try:
-        from part5_masking import run_masking
-        _, _ = run_masking(cleaned_df, output_dir=output_dir)
-        logger.info(
-            "[Stage 6] Masking complete. "
-            "-> masked_sample.txt, customers_masked.csv"
-        )
-        stage_results["masking"] = {
-            "status": "SUCCESS",
-            "detail": "All PII columns masked",
-            "files": ["masked_sample.txt", "customers_masked.csv"],
-        }
-    except Exception as exc:
-        logger.warning(f"[Stage 6] Masking failed: {exc}\n{traceback.format_exc()}")
-        stage_results["masking"] = {"status": "FAILED", "detail": str(exc)}
-        
-        
-        
+    key, info, _ = _stage_masking(cleaned_df, output_dir)
+    stage_results[key] = info
+
+
+
     # Stage 7: Generate pipeline execution report
     end_time = datetime.now()
     elapsed = (end_time - start_time).total_seconds()
@@ -249,11 +396,12 @@ def run_pipeline(
         "pipeline_execution_report.txt",
     ]
 
-    # Verify files exist
+    # Verify files exist (one directory listing instead of a stat per file)
+    present = {entry.name for entry in os.scandir(output_dir)}
+    statuses = {f: f in present for f in all_files}
     missing_files = [
-        f for f in all_files
-        if not os.path.exists(os.path.join(output_dir, f))
-        and f != "pipeline_execution_report.txt"
+        f for f, ok in statuses.items()
+        if not ok and f != "pipeline_execution_report.txt"
     ]
 
     overall_status = (
@@ -273,17 +421,10 @@ def run_pipeline(
     report_lines.append(f"Duration : {elapsed:.2f} seconds")
     report_lines.append("")
 
-    stage_labels = {
-        "load":       ("1", "Data loaded",                 input_csv_path),
-        "quality":    ("2", "Quality profiling complete",  "data_quality_report.txt"),
-        "pii":        ("3", "PII detection complete",      "pii_detection_report.txt"),
-        "validation": ("4", "Validation complete",         "validation_results.txt"),
-        "cleaning":   ("5", "Data cleaning complete",      "cleaning_log.txt, customers_cleaned.csv"),
-        "masking":    ("6", "PII masking complete",        "masked_sample.txt, customers_masked.csv"),
-    }
-
     report_lines.append("STEPS COMPLETED:")
-    for key, (num, label, files) in stage_labels.items():
+    for key, (num, label, files) in _STAGE_LABELS.items():
+        if files is None:  # the load step reports the input path
+            files = input_csv_path
         info = stage_results.get(key, {})
         status_sym = "[OK]" if info.get("status") in ("SUCCESS", "WARNINGS") else "[FAIL]"
         detail = info.get("detail", "")
@@ -295,9 +436,8 @@ def run_pipeline(
 
     report_lines.append("")
     report_lines.append("FILES GENERATED:")
-    for f in all_files:
-        full_path = os.path.join(output_dir, f)
-        exists_sym = "[OK]" if os.path.exists(full_path) else "[MISSING]"
+    for f, ok in statuses.items():
+        exists_sym = "[OK]" if ok else "[MISSING]"
         report_lines.append(f"  - {f} {exists_sym}")
 
     if missing_files:
@@ -316,21 +456,25 @@ def run_pipeline(
     report_lines.append("  - PII Risk: MITIGATED (all PII columns masked)")
     report_lines.append(f"Status: {overall_status}")
 
-    report_text = "\n".join(report_lines)
+    # Encoded once; the same bytes go to the report file and to stdout
+    encoded_lines = [line.encode("utf-8") + b"\n" for line in report_lines]
 
     # Write report
     report_path = os.path.join(output_dir, "pipeline_execution_report.txt")
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(report_text)
+    with open(report_path, "wb", buffering=REPORT_BUFFER_SIZE) as f:
+        # The file has no trailing newline, so the last line drops its own
+        f.writelines(encoded_lines[:-1])
+        f.write(encoded_lines[-1][:-1])
 
     logger.info("[Stage 7] Pipeline execution report written.")
     logger.info("=" * 60)
-    logger.info(f"PIPELINE COMPLETE  -  Status: {overall_status}")
-    logger.info(f"Total duration: {elapsed:.2f}s")
+    logger.info("PIPELINE COMPLETE  -  Status: %s", overall_status)
+    logger.info("Total duration: %.2fs", elapsed)
     logger.info("=" * 60)
 
     # Use sys.stdout.buffer for safe UTF-8 output on Windows terminals
-    sys.stdout.buffer.write(("\n" + report_text + "\n").encode("utf-8"))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.writelines(encoded_lines)
 
 
 
@@ -339,5 +483,6 @@ def run_pipeline(
 if __name__ == "__main__":
     csv_path   = sys.argv[1] if len(sys.argv) > 1 else "customers_raw.csv"
     out_dir    = sys.argv[2] if len(sys.argv) > 2 else "."
+    workers    = int(sys.argv[3]) if len(sys.argv) > 3 else 1
 
-    run_pipeline(input_csv_path=csv_path, output_dir=out_dir)
+    run_pipeline(input_csv_path=csv_path, output_dir=out_dir, workers=workers)
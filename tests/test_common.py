@@ -0,0 +1,50 @@
+"""Tests for common."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from common import normalize_text, parse_dates
+
+FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y")
+
+DATES = [
+    "1985-03-15", "03/15/1985", "15/03/1985", " 1990-1-5 ", " 2020-02-29 ",
+    "2021-02-29", "1990-13-01", "invalid_date", "", "   ", None, "2020-01-01T00:00",
+    "0999-01-01", "01/02/0099", "0001-01-01", "1600-01-01", "1677-09-21",
+    "1677-09-22", "2262-04-11", "2262-04-12", "9999-12-31",
+    "２０２０-01-01", "١٩٩٩-12-31", "2020-١٢-31", "2020/01/01", "20200101",
+]
+
+
+def _strptime_days(values, formats):
+    """The per-cell strptime loop parse_dates replaced."""
+    days = []
+    for v in values:
+        day = np.datetime64("NaT", "D")
+        if isinstance(v, str):
+            for fmt in formats:
+                try:
+                    day = np.datetime64(datetime.strptime(v.strip(), fmt).date(), "D")
+                    break
+                except ValueError:
+                    pass
+        days.append(day)
+    return np.array(days, dtype="datetime64[D]")
+
+
+def test_parse_dates_matches_strptime():
+    stripped = pd.Series(DATES, dtype=object).astype("string").str.strip()
+    np.testing.assert_array_equal(
+        parse_dates(stripped, FORMATS), _strptime_days(DATES, FORMATS)
+    )
+
+
+def test_normalize_text_matches_str_strip():
+    values = ["  a ", " b　", "\x1cc\x1f", "", " \t\n", None, "d"]
+    expected = [
+        v.strip() or None if isinstance(v, str) else None for v in values
+    ]
+    result = normalize_text(pd.Series(values, dtype=object))
+    assert [None if pd.isna(v) else v for v in result] == expected
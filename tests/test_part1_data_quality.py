@@ -0,0 +1,184 @@
+"""Tests for part1_data_quality."""
+
+import csv
+import re
+from datetime import date, datetime
+
+import pandas as pd
+
+import part1_data_quality as p1
+
+
+def _read_with_pandas(path):
+    """The pandas fallback of load_raw_csv, used as the reference reader."""
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return df.mask(df.eq(""))
+
+
+def test_load_raw_csv_quoted_newline_beyond_first_block(tmp_path):
+    # Several of Arrow's 1 MiB blocks, with multi-line cells throughout, so
+    # block boundaries fall next to quoted newlines
+    path = tmp_path / "multiline.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["customer_id", "address", "income"])
+        for i in range(20_000):
+            street = "12 Main St\nApt 4" if i % 3 == 0 else f"{i} Elm Road"
+            writer.writerow([i, street + "x" * 200, "" if i % 7 == 1 else i])
+    assert path.stat().st_size > 4 << 20
+
+    loaded = p1.load_raw_csv(str(path))
+    expected = _read_with_pandas(path)
+    assert len(loaded) == 20_000
+    assert loaded.loc[999, "address"].startswith("12 Main St\nApt 4x")
+    pd.testing.assert_frame_equal(
+        loaded.astype(object).where(loaded.notna(), None),
+        expected.astype(object).where(expected.notna(), None),
+    )
+
+
+COLUMNS = [
+    "customer_id", "first_name", "last_name", "email", "phone",
+    "date_of_birth", "address", "income", "account_status", "created_date",
+]
+
+
+def _frame(**columns):
+    """A raw-shaped frame: the given columns, every other one blank."""
+    n = len(next(iter(columns.values())))
+    return pd.DataFrame({c: columns.get(c, [None] * n) for c in COLUMNS}, dtype=object)
+
+
+def _income_issues_scalar(values):
+    """The per-cell float() income checks check_invalid_values replaced."""
+    issues = []
+    for row, val in enumerate(values, start=2):
+        v = str(val).strip()
+        if not v:
+            continue
+        try:
+            num = float(v)
+        except ValueError:
+            issues.append(("non_numeric_income", row))
+            continue
+        if num < 0:
+            issues.append(("negative_income", row))
+        if num > 10_000_000:
+            issues.append(("income_exceeds_10M", row))
+    return sorted(issues)
+
+
+def test_income_checks_match_float():
+    values = [
+        "50000", " 1_000 ", "nan", "NaN", "inf", "-inf", "1e8", "-3.5", "abc",
+        "1,000", "", "  ", float("nan"), "\u00a012\u00a0", "١٢٣", "0x10", "+7",
+    ]
+    issues = p1.check_invalid_values(_frame(income=values))
+    found = sorted(
+        (i["type"], i["row"]) for i in issues if i["column"] == "income"
+    )
+    assert found == _income_issues_scalar(values)
+
+
+def _strptime(v, formats):
+    for fmt in formats:
+        try:
+            return datetime.strptime(v, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+def _classify_scalar(values, patterns, fallback, flags=0):
+    """The per-value first-match loop of detect_phone/date_formats."""
+    found = {}
+    for val in values:
+        if pd.isna(val) or not str(val).strip():
+            continue
+        v = str(val).strip()
+        name = next((n for n, p in patterns.items() if re.match(p, v, flags)), fallback)
+        found.setdefault(name, []).append(v)
+    return found
+
+
+def _row_checks_scalar(df):
+    """
+    The per-cell loops of check_completeness, check_invalid_values (dates),
+    check_account_status and check_name_casing, as (type, column, row).
+    Missing names are skipped rather than flagged as 'nan'.
+    """
+    today = date.today()
+    missing = {c: int(df[c].apply(lambda v: pd.isna(v) or str(v).strip() == "").sum())
+               for c in df.columns}
+    issues = []
+    for col in ("date_of_birth", "created_date"):
+        for row, val in enumerate(df[col], start=2):
+            if str(val).strip().lower() == "invalid_date":
+                issues.append(("invalid_date_string", col, row))
+    for col, formats, kind in (
+        ("date_of_birth", p1.DOB_FORMATS, "extreme_age"),
+        ("created_date", p1.CREATED_DATE_FORMATS, "future_created_date"),
+    ):
+        for row, val in enumerate(df[col], start=2):
+            if pd.isna(val):
+                continue
+            parsed = _strptime(str(val).strip(), formats)
+            if parsed is None:
+                continue
+            if kind == "extreme_age" and (today - parsed).days / 365.25 > 150:
+                issues.append((kind, col, row))
+            if kind == "future_created_date" and parsed > today:
+                issues.append((kind, col, row))
+    for row, val in enumerate(df["account_status"], start=2):
+        v = str(val).strip().lower()
+        if v and not pd.isna(val) and v not in p1.VALID_ACCOUNT_STATUSES:
+            issues.append(("invalid_account_status", "account_status", row))
+    for col in ("first_name", "last_name"):
+        for row, val in enumerate(df[col], start=2):
+            v = "" if pd.isna(val) else str(val).strip()
+            if v.isupper() and len(v) > 1:
+                issues.append(("name_all_caps", col, row))
+            elif v.islower() and len(v) > 1:
+                issues.append(("name_all_lower", col, row))
+    return missing, sorted(issues)
+
+
+EDGE_VALUES = [
+    "john", "MARY", "o'neil", "ŒDIPUS", "straße", "ǅemal", "ß", "x", " anne ",
+    "\u00a0", "  ", "", None, float("nan"), "nan",
+    "555-123-4567", "５５５-１２３-４５６７", "(555) 123-4567", "555.123.4567",
+    "٥٥٥١٢٣٤٥٦٧", "+1-555-123-4567", " 5551234567 ", "555-123-4567\n",
+    "1985-03-15", "03/15/1985", "15/03/1985", "２０２０-01-01", "0999-01-01",
+    "01/02/0099", "1600-01-01", "1677-09-22", "2262-04-12", "9999-12-31",
+    "invalid_date", " INVALID_DATE ", "2021-02-29",
+    "active", " Inactive ", "SUSPENDED", "closed",
+]
+
+
+def test_row_checks_match_scalar_loops():
+    df = _frame(**{c: EDGE_VALUES for c in COLUMNS})
+    masks = p1._compute_masks(df)
+    missing, expected = _row_checks_scalar(df)
+
+    completeness = p1.check_completeness(df, masks)
+    assert {c: info["missing"] for c, info in completeness.items()} == missing
+    issues = (
+        p1.check_invalid_values(df, masks)
+        + p1.check_account_status(df, masks)
+        + p1.check_name_casing(df, masks)
+    )
+    found = sorted(
+        (i["type"], i["column"], i["row"]) for i in issues if i["column"] != "income"
+    )
+    assert found == expected
+
+
+def test_format_detection_matches_scalar_loops():
+    df = _frame(**{c: EDGE_VALUES for c in COLUMNS})
+    assert p1.detect_phone_formats(df) == _classify_scalar(
+        EDGE_VALUES, p1.PHONE_PATTERNS, "Other / Unrecognised"
+    )
+    expected = _classify_scalar(
+        EDGE_VALUES, p1.DATE_PATTERNS, "Other / Unparseable", re.IGNORECASE
+    )
+    assert p1.detect_date_formats(df) == {"date_of_birth": expected, "created_date": expected}
@@ -0,0 +1,65 @@
+"""Tests for part2_pii_detection."""
+
+import pandas as pd
+
+import part2_pii_detection as p2
+
+
+def test_phone_detection_matches_non_ascii_digits():
+    df = pd.DataFrame({"phone": ["５５５-１２３-４５６７", "555-123-4567", None, " "]})
+    assert p2.detect_phone_pii(df) == [0, 1]
+    assert [i for i, v in enumerate(df["phone"])
+            if isinstance(v, str) and p2.PHONE_PATTERN.search(v.strip())] == [0, 1]
+
+
+def _present(val):
+    return not pd.isna(val) and str(val).strip() != ""
+
+
+def _inventory_scalar(df):
+    """The per-cell detectors and row inventory run_pii_detection replaced."""
+    def matches(col, pattern):
+        return {i for i, v in enumerate(df[col]) if pattern.search(str(v).strip())}
+
+    def present(*cols):
+        return {i for col in cols for i, v in enumerate(df[col]) if _present(v)}
+
+    by_type = {
+        "Name (first/last)": present("first_name", "last_name"),
+        "Email": matches("email", p2.EMAIL_PATTERN),
+        "Phone": matches("phone", p2.PHONE_PATTERN),
+        "Address": present("address"),
+        "Date of Birth": present("date_of_birth"),
+        "Income": present("income"),
+    }
+    inventory = {}
+    for i in range(len(df)):
+        labels = [label for label in p2.PII_TYPE_LABELS if i in by_type[label]]
+        if labels:
+            inventory[i] = labels
+    return inventory
+
+
+def test_row_inventory_matches_scalar_detectors():
+    values = [
+        "a@b.co", "x", "  ", None, "５５５-１２３-４５６７", "(555) 123-4567",
+        " A.B@EXAMPLE.ORG ", "nan", " ", "555 123 4567",
+        "1985-03-15", "0999-01-01", "١٢٣",
+    ]
+    n = len(values)
+    df = pd.DataFrame({
+        "first_name": values,
+        "last_name": list(reversed(values)),
+        "email": values[3:] + values[:3],
+        "phone": values[5:] + values[:5],
+        "address": values[1:] + values[:1],
+        "date_of_birth": values[7:] + values[:7],
+        "income": values[2:] + values[:2],
+    }, dtype=object)
+    rows = (
+        p2.detect_email_pii(df), p2.detect_phone_pii(df), p2.detect_address_pii(df),
+        p2.detect_dob_pii(df), p2.detect_name_pii(df), p2.detect_income_pii(df),
+    )
+    inventory = p2.build_row_pii_inventory(df, *rows)
+    assert inventory.shape == (n, len(p2.PII_TYPE_LABELS))
+    assert p2.inventory_to_dict(inventory) == _inventory_scalar(df)
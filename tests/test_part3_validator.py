@@ -0,0 +1,221 @@
+"""Tests for part3_validator."""
+
+import re
+from datetime import date, datetime
+
+import pandas as pd
+
+import part3_validator as p3
+
+
+def test_phone_digit_count_includes_non_ascii_digits():
+    series = pd.Series(["５５５１２３４５６７", "555-123-4567", "12345"])
+    assert [f.row for f in p3.validate_phone(series)] == [4]
+
+
+def test_name_whitespace_is_unicode_aware():
+    series = pd.Series(["Mary Ann", "Mary Ann", "R2-D2"])
+    assert [f.row for f in p3.validate_name(series, "first_name")] == [4]
+
+
+def _column_cases(n):
+    """Columns that are uniform, or look uniform in their first rows only."""
+    late = ["x"] * n
+    late[-1] = "y"
+    padded = ["555-123-4567"] * n
+    padded[n // 2] = " 555-123-4567 "
+    return {
+        "constant": ["ab"] * n,
+        "constant_with_na": ["ab", None, "  "] * (n // 3),
+        "all_na": [None] * n,
+        "all_blank": ["  "] * n,
+        "differs_after_probe": late,
+        "differs_in_probe": ["ab", "cd"] * (n // 2),
+        "padding_differs": padded,
+        "bad_constant": ["!!"] * n,
+    }
+
+
+def _keyed(failures):
+    return [(f.row, f.column, str(f.value), f.rule) for f in failures]
+
+
+def test_uniform_short_circuit_matches_full_validation():
+    n = 3 * p3.UNIFORM_PROBE_ROWS
+    validators = {
+        "first_name": lambda s: p3.validate_name(s, "first_name"),
+        "email": p3.validate_email,
+        "phone": p3.validate_phone,
+        "date_of_birth": lambda s: p3.validate_date_column(s, "date_of_birth"),
+        "created_date": lambda s: p3.validate_date_column(s, "created_date"),
+        "address": p3.validate_address,
+        "income": p3.validate_income,
+        "account_status": p3.validate_account_status,
+    }
+    for case, values in _column_cases(n).items():
+        df = pd.DataFrame({c: values for c in p3.COLUMN_ORDER}, dtype=object)
+        df["customer_id"] = [str(i) for i in range(1, len(values) + 1)]
+        results = p3.run_all_validators(df, parallel=False)
+        for col, validate in validators.items():
+            assert _keyed(results.get(col, [])) == _keyed(validate(df[col])), (case, col)
+
+
+def _income_failures_scalar(values):
+    """The per-cell float() validate_income loop."""
+    failures = []
+    for row, val in enumerate(values, start=2):
+        if pd.isna(val) or str(val).strip() == "":
+            failures.append((row, "Must be non-empty numeric value"))
+            continue
+        try:
+            num = float(str(val).strip())
+        except ValueError:
+            failures.append((row, "Must be a numeric value"))
+            continue
+        if num < 0:
+            failures.append((row, "Income must be non-negative"))
+        if num > 10_000_000:
+            failures.append((row, "Income exceeds $10,000,000 upper bound"))
+    return failures
+
+
+def test_income_matches_float():
+    values = [
+        "50000", " 1_000 ", "nan", "inf", "-1", "2e7", "abc", "1,000", "",
+        " ", None, "١٢٣", " 12 ", "0x10",
+    ]
+    failures = p3.validate_income(pd.Series(values, dtype=object))
+    assert [(f.row, f.rule) for f in failures] == _income_failures_scalar(values)
+
+
+def _missing(val):
+    return pd.isna(val) or str(val).strip() == ""
+
+
+def _scalar_validators():
+    """The per-cell validators the vectorised ones replaced: col -> fn(values)."""
+    def customer_id(values):
+        out, seen = [], {}
+        for row, val in enumerate(values, start=2):
+            v = "" if pd.isna(val) else str(val).strip()
+            if not v:
+                out.append((row, val, "Must be a positive integer (missing)"))
+                continue
+            try:
+                if int(float(v)) <= 0:
+                    out.append((row, val, "Must be a positive integer (value <= 0)"))
+                    continue
+            except (ValueError, TypeError):
+                out.append((row, val, "Must be a positive integer (non-numeric)"))
+                continue
+            if v in seen:
+                out.append((row, val, f"Must be unique (duplicate of row {seen[v]})"))
+            else:
+                seen[v] = row
+        return out
+
+    def name(values):
+        out = []
+        for row, val in enumerate(values, start=2):
+            if _missing(val):
+                out.append((row, val, "Must be non-empty"))
+                continue
+            v = str(val).strip()
+            if not 2 <= len(v) <= 50:
+                out.append((row, val, "Length must be between 2 and 50 characters"))
+            if not p3.NAME_REGEX.match(v):
+                out.append((row, val, "Must contain only letters, spaces, hyphens, or apostrophes"))
+        return out
+
+    def email(values):
+        out = []
+        for row, val in enumerate(values, start=2):
+            if _missing(val):
+                out.append((row, val, "Must be non-empty"))
+            elif not p3.EMAIL_REGEX.match(str(val).strip()):
+                out.append((row, val, "Must be a valid email address format"))
+        return out
+
+    def phone(values):
+        out = []
+        for row, val in enumerate(values, start=2):
+            if _missing(val):
+                out.append((row, val, "Must be non-empty"))
+                continue
+            n = len(re.sub(r"\D", "", str(val)))
+            if not 10 <= n <= 15:
+                out.append((row, val, f"Stripped digit count must be 10–15 (got {n})"))
+        return out
+
+    def dates(col):
+        def validate(values):
+            out, today = [], date.today()
+            for row, val in enumerate(values, start=2):
+                if _missing(val):
+                    continue
+                v = str(val).strip()
+                if v.lower() == "invalid_date":
+                    out.append((row, val, "Not a valid date (literal 'invalid_date' string)"))
+                    continue
+                parsed = None
+                for fmt in p3.DATE_FORMATS:
+                    try:
+                        parsed = datetime.strptime(v, fmt).date()
+                        break
+                    except ValueError:
+                        pass
+                if parsed is None:
+                    out.append((row, val, "Could not be parsed as a valid date"))
+                    continue
+                if parsed > today:
+                    out.append((row, val, "Date must not be in the future"))
+                if col == "date_of_birth":
+                    age = (today - parsed).days / 365.25
+                    if age > 150:
+                        out.append((row, val, f"Date of birth implies age > 150 years (~{age:.1f} years)"))
+                    elif age < 0:
+                        out.append((row, val, "Date of birth is in the future"))
+            return out
+        return validate
+
+    def address(values):
+        return [(row, val, "Must be non-empty")
+                for row, val in enumerate(values, start=2) if _missing(val)]
+
+    def account_status(values):
+        out = []
+        for row, val in enumerate(values, start=2):
+            if _missing(val):
+                out.append((row, val, "Must be one of: active, inactive, suspended (missing)"))
+            elif str(val).strip().lower() not in ("active", "inactive", "suspended"):
+                out.append((row, val, f"Must be one of: active, inactive, suspended (got '{val}')"))
+        return out
+
+    return {
+        "customer_id": customer_id, "first_name": name, "last_name": name,
+        "email": email, "phone": phone,
+        "date_of_birth": dates("date_of_birth"), "created_date": dates("created_date"),
+        "address": address, "account_status": account_status,
+    }
+
+
+EDGE_VALUES = [
+    "1", " 2 ", "2", "-3", "0", "1.0", "abc", None, "", "   ", "\u00a0",
+    "Mary Ann", "Mary\u00a0Ann", "O'Neil", "R2-D2", "x", "Ø" * 51, "straße",
+    "a@b.co", " A.B@EXAMPLE.ORG ", "a@b", "ä@b.co",
+    "555-123-4567", "５５５１２３４５６７", "+1 (555) 123-4567 ext 12345", "١٢٣",
+    "1985-03-15", "03/15/1985", "15/03/1985", " 1990-1-5 ", "0999-01-01",
+    "01/02/0099", "1600-01-01", "1677-09-22", "2262-04-12", "9999-12-31",
+    "２０２０-01-01", "invalid_date", "INVALID_DATE", "2021-02-29",
+    "active", " Inactive ", "SUSPENDED", "closed", "nan",
+]
+
+
+def test_validators_match_scalar_reference():
+    values = pd.Series(EDGE_VALUES, dtype=object)
+    df = pd.DataFrame({c: values for c in p3.COLUMN_ORDER})
+    results = p3.run_all_validators(df, parallel=False)
+    for col, reference in _scalar_validators().items():
+        found = [(f.row, str(f.value), f.rule) for f in results.get(col, [])]
+        expected = [(row, str(val), rule) for row, val, rule in reference(EDGE_VALUES)]
+        assert found == expected, col
@@ -0,0 +1,218 @@
+"""Tests for part4_cleaning."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+import part4_cleaning as p4
+
+
+def _blank(v):
+    return pd.isna(v) or str(v).strip() == ""
+
+
+def _clean_scalar(df):
+    """
+    Steps 1-5 of run_cleaning as the original per-cell loops over
+    normalise_phone, normalise_date, normalise_name and _safe_float.
+    Returns the cleaned frame and its log lines.
+    """
+    cleaned = df.copy()
+    log = ["DATA CLEANING LOG", "", "ACTIONS TAKEN:", "-" * 50]
+
+    changes, flags = [], []
+    for idx, val in cleaned["phone"].items():
+        norm, note = p4.normalise_phone(val)
+        if note:
+            flags.append(f"    Row {idx+2}: '{val}' -> flagged: {note}")
+        elif str(norm) != str(val):
+            changes.append(f"    Row {idx+2}: '{val}' -> '{norm}'")
+            cleaned.at[idx, "phone"] = norm
+    log.append("\nNormalisation:")
+    log.append(f"  Phone format: Converted to XXX-XXX-XXXX ({len(changes)} row(s) affected)")
+    log.extend(changes)
+    if flags:
+        log.append(f"  Phone flags ({len(flags)} rows could not be normalised):")
+        log.extend(flags)
+
+    changes, nulled = [], []
+    for col in ["date_of_birth", "created_date"]:
+        for idx, val in cleaned[col].items():
+            if _blank(val):
+                continue
+            norm, note = p4.normalise_date(val)
+            if note:
+                nulled.append(f"    Row {idx+2} [{col}]: '{val}' — {note}")
+                cleaned.at[idx, col] = pd.NA
+            elif norm and norm != str(val).strip():
+                changes.append(f"    Row {idx+2} [{col}]: '{val}' -> '{norm}'")
+                cleaned.at[idx, col] = norm
+    log.append(f"\n  Date format: Converted to YYYY-MM-DD ({len(changes)} row(s) reformatted)")
+    log.extend(changes)
+    if nulled:
+        log.append(f"  Invalid/unparseable dates set to NaN ({len(nulled)} occurrence(s)):")
+        log.extend(nulled)
+
+    changes = []
+    for col in ["first_name", "last_name"]:
+        for idx, val in cleaned[col].items():
+            norm, note = p4.normalise_name(val)
+            if note:
+                changes.append(f"    Row {idx+2} [{col}]: {note}")
+                cleaned.at[idx, col] = norm
+    log.append(f"\n  Name casing: Applied title case ({len(changes)} row(s) affected)")
+    log.extend(changes)
+
+    log.append("\nMissing Values:")
+    fills = {"first_name": "[UNKNOWN]", "last_name": "[UNKNOWN]",
+             "address": "[UNKNOWN]", "income": "0", "account_status": "unknown"}
+    for col, fill in fills.items():
+        missing = cleaned[col].apply(_blank)
+        if missing.sum():
+            cleaned.loc[missing, col] = fill
+            log.append(f"  {col}: {int(missing.sum())} row(s) missing -> filled with '{fill}'")
+        else:
+            log.append(f"  {col}: 0 rows missing — no action needed")
+    log.append(
+        f"  date_of_birth: {int(cleaned['date_of_birth'].apply(_blank).sum())} "
+        f"row(s) missing -> left as NaN (cannot be inferred)"
+    )
+
+    log.append("\nInvalid Values:")
+    dupes = cleaned["customer_id"].astype(str).duplicated(keep="first")
+    if dupes.any():
+        info = [f"Row {i+2} (ID={cleaned.at[i, 'customer_id']})" for i in cleaned.index[dupes]]
+        cleaned = cleaned[~dupes].reset_index(drop=True)
+        log.append(f"  Duplicate customer_id: {len(info)} row(s) dropped — " + ", ".join(info))
+    else:
+        log.append("  Duplicate customer_id: none found")
+
+    income = cleaned["income"].apply(
+        lambda v: 0 if _blank(v) else p4._safe_float(str(v).strip(), default=0)
+    )
+    neg = income < 0
+    if neg.any():
+        rows = [f"Row {i+2}: original income = {cleaned.at[i, 'income']}" for i in cleaned.index[neg]]
+        cleaned.loc[neg, "income"] = "0"
+        log.append(f"  Negative income: {int(neg.sum())} row(s) set to 0 — " + ", ".join(rows))
+    else:
+        log.append("  Negative income: none found")
+    high = income > 10_000_000
+    if high.any():
+        rows = [f"Row {i+2}: income = {cleaned.at[i, 'income']}" for i in cleaned.index[high]]
+        log.append(f"  Income > $10M: {int(high.sum())} row(s) flagged for review (NOT modified) — "
+                   + ", ".join(rows))
+    else:
+        log.append("  Income > $10M: none found")
+
+    bad = cleaned["account_status"].apply(
+        lambda v: not _blank(v) and str(v).strip().lower() not in p4.VALID_STATUSES
+    )
+    if bad.any():
+        rows = [f"Row {i+2}: '{cleaned.at[i, 'account_status']}'" for i in cleaned.index[bad]]
+        log.append(f"  Invalid account_status: {int(bad.sum())} row(s) flagged for review — "
+                   + ", ".join(rows))
+    else:
+        log.append("  Invalid account_status: none found")
+
+    today = date.today()
+
+    def parse_flag_date(v):
+        if _blank(v):
+            return None
+        for fmt in p4.FLAG_DATE_FORMATS:
+            try:
+                return datetime.strptime(str(v).strip(), fmt).date()
+            except ValueError:
+                pass
+        return None
+
+    future = cleaned["created_date"].apply(lambda v: (parse_flag_date(v) or date.min) > today)
+    if future.any():
+        rows = [f"Row {i+2}: '{cleaned.at[i, 'created_date']}'" for i in cleaned.index[future]]
+        log.append(f"  Future created_date: {int(future.sum())} row(s) flagged for review (NOT modified) — "
+                   + ", ".join(rows))
+    else:
+        log.append("  Future created_date: none found")
+
+    rows = []
+    for idx, val in cleaned["date_of_birth"].items():
+        dob = parse_flag_date(val)
+        if dob is not None and (today - dob).days / 365.25 > 150:
+            rows.append(f"Row {idx+2}: DOB '{val}' (~{(today - dob).days / 365.25:.1f} years old)")
+            cleaned.at[idx, "date_of_birth"] = pd.NA
+    if rows:
+        log.append(f"  Age > 150: {len(rows)} row(s) — DOB set to NaN — " + ", ".join(rows))
+    else:
+        log.append("  Age > 150: none found")
+    return cleaned, log
+
+
+def _comparable(df):
+    """Cells as plain str, missing (NaN, NA, None) as None."""
+    df = df.astype(object)
+    return df.where(df.notna(), None).apply(
+        lambda col: col.map(lambda v: v if v is None else str(v))
+    )
+
+
+EDGE_ROWS = [
+    # phone, date_of_birth, created_date, first_name, income, account_status
+    ("555-123-4567", "1985-03-15", "2024-01-10", "john", "50000", "active"),
+    ("(555) 123-4567", "03/15/1985", "01/10/2024", "MARY", "-5", "Inactive"),
+    ("+1 555 123 4567", "15/03/1985", "2024/01/10", "o'neil", "1_000", " suspended "),
+    ("５５５-１２３-４５６７", "２０２０-01-01", "١٩٩٩-12-31", "ŒDIPUS", "١٢٣", "closed"),
+    ("12345", "0999-01-01", "01/02/0099", "straße", "nan", "ACTIVE"),
+    ("  ", "1600-01-01", "2300-05-05", "  ", "  ", "  "),
+    (None, None, None, None, None, None),
+    (" 5551234567 ", " 1990-1-5 ", "9999-12-31", " anne ", "2e7", "unknown"),
+    ("1-555-123-4567 x", "invalid_date", "INVALID_DATE", "Jean-luc", "abc", "active"),
+    ("555.123.4567", "1990-02-30", "2020-13-01", "Ø", "20000001", "active"),
+    ("5551234567", "1875-06-01", "2262-04-12", "mcdonald", "0x10", "active"),
+    ("555-123-4567", "1677-09-21", "1677-09-22", "j", "+7", "active"),
+]
+
+
+def _edge_frame():
+    n = len(EDGE_ROWS)
+    cols = list(zip(*EDGE_ROWS))
+    df = pd.DataFrame({
+        "customer_id": [str(i % (n - 1) + 1) for i in range(n)],  # one duplicate
+        "first_name": cols[3],
+        "last_name": list(reversed(cols[3])),
+        "email": ["a@b.co"] * n,
+        "phone": cols[0],
+        "date_of_birth": cols[1],
+        "address": ["1 Main St"] * (n - 1) + [None],
+        "income": cols[4],
+        "account_status": cols[5],
+        "created_date": cols[2],
+    }, dtype=object)
+    return df.where(df.notna(), np.nan)
+
+
+def test_cleaning_steps_match_scalar_reference(tmp_path):
+    df = _edge_frame()
+    cleaned, log = p4.run_cleaning(df, output_dir=str(tmp_path))
+    expected, expected_log = _clean_scalar(df)
+
+    steps = log.split("\n\nValidation After Cleaning:")[0]
+    assert steps.split("\n") == "\n".join(expected_log).split("\n")
+    pd.testing.assert_frame_equal(_comparable(cleaned), _comparable(expected))
+
+
+def test_write_csv_matches_pandas_writer(tmp_path):
+    frames = [
+        pd.DataFrame({"a": ["x", "", None, "é ü"], "b": ["1", "2", "3", " 4 "]}, dtype=object),
+        pd.DataFrame({"a": ["x", 'say "hi"', "y"], "b": ["1,5", "2", None]}, dtype=object),
+        pd.DataFrame({"a": ["line\nbreak", "cr\r", "z"], "b": ["p", "q", "r"]}, dtype=object),
+        pd.DataFrame({"a": pd.Categorical(["on", "off", None]), "b": ["1", "2", "3"]}),
+        pd.DataFrame({"a": ["x", "y"], "b": [1.5, None]}),
+        pd.DataFrame({"a": ["", None]}, dtype=object),
+    ]
+    for i, df in enumerate(frames):
+        ours, reference = tmp_path / f"ours{i}.csv", tmp_path / f"ref{i}.csv"
+        p4.write_csv(df, str(ours))
+        df.to_csv(reference, index=False, lineterminator="\n")
+        assert ours.read_bytes() == reference.read_bytes(), i
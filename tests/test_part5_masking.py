@@ -0,0 +1,46 @@
+"""Tests for part5_masking."""
+
+import pandas as pd
+
+import part5_masking as p5
+
+
+def test_mask_phones_matches_mask_phone():
+    values = [
+        "555-123-4567", "５５５１２３４５６７", "+1 (555) 123-4567", "1-555-123-4567",
+        "555.123.4567", "12345", "abc", "  555 123 4567 ", "", "   ", None,
+    ]
+    s = pd.Series(values, dtype=object)
+    assert p5._mask_phones(s).tolist() == [p5.mask_phone(v) for v in s]
+
+
+MASKERS = {
+    "first_name": p5.mask_name, "last_name": p5.mask_name, "email": p5.mask_email,
+    "phone": p5.mask_phone, "address": p5.mask_address, "date_of_birth": p5.mask_dob,
+}
+
+EDGE_VALUES = [
+    "John", " anne ", "Ø", "ŒDIPUS", "straße", "x", "[UNKNOWN]", " Mary ",
+    "john.doe@example.com", " A@B.CO ", "no-at-sign", "@b.co", "ä@b.co",
+    "555-123-4567", "５５５-１２３-４５６７", "(555) 123-4567", "12345",
+    "123 Main St", "1985-03-15", "٢٠٢٠-01-01", "0999-01-01", "1600-01-01",
+    "9999-12-31", "03/15/1985", "invalid_date", "", "   ", None, float("nan"),
+]
+
+
+def test_apply_masking_matches_mask_functions():
+    df = pd.DataFrame({c: EDGE_VALUES for c in MASKERS}, dtype=object)
+    masked = p5.apply_masking(df)
+    for col, mask in MASKERS.items():
+        assert masked[col].astype(object).tolist() == [mask(v) for v in df[col]], col
+
+
+def test_apply_masking_matches_mask_functions_on_uniform_columns():
+    # Columns where every value has the cleaned shape take the fast paths
+    for col, values in [
+        ("phone", ["555-123-4567", "212-555-0100", "000-000-0000"]),
+        ("date_of_birth", ["1985-03-15", "0999-01-01", "9999-12-31"]),
+    ]:
+        df = pd.DataFrame({c: values for c in MASKERS}, dtype=object)
+        masked = p5.apply_masking(df)
+        assert masked[col].astype(object).tolist() == [MASKERS[col](v) for v in values], col